@@ -4,17 +4,45 @@ Laravel Backend Complete Setup
 Crea proyecto Laravel con Docker + genera backend desde modelo Workbench
 """
 
+import errno
 import os
 import re
 import subprocess
 import shutil
 import zipfile
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 ZIP_DEFAULT = "backend-repo.zip"
 GENERATOR_SCRIPT = "laravel_generator.py"
+ORIGINAL_DIR = Path(__file__).resolve().parent
+APP_DOCKERFILE = "docker/php/Dockerfile"
+
+# Salidas del generador que se mueven al proyecto mientras aún se genera
+EARLY_COPY_DIRS = {
+    "migrations": "database/migrations",
+    "models": "app/Models",
+    "controllers": "app/Http/Controllers/Api",
+}
+WATCH_INTERVAL = 0.1
+
+# Se inserta bajo el servicio db de docker-compose.yml
+MYSQL_HEALTHCHECK = """
+{indent}healthcheck:
+{indent}  test: ["CMD", "mysqladmin", "ping", "-h", "localhost", "-uroot", "-proot"]
+{indent}  interval: 2s
+{indent}  timeout: 3s
+{indent}  retries: 30"""
+
+# Variables de BD que se sobrescriben en .env
+ENV_DB_RE = re.compile(r"(DB_USERNAME|DB_PASSWORD|DB_DATABASE|DB_HOST|DB_PORT)=.*")
+
+# BuildKit permite reutilizar capas de builds anteriores (cache_from)
+DOCKER_BUILD_ENV = {**os.environ, 'DOCKER_BUILDKIT': '1', 'COMPOSE_DOCKER_CLI_BUILD': '1'}
 
 
 class Colors:
@@ -28,6 +56,12 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Sin terminal (salida redirigida a un log) no tiene sentido emitir colores ANSI
+if not sys.stdout.isatty():
+    for _attr in ('HEADER', 'BLUE', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'END', 'BOLD'):
+        setattr(Colors, _attr, '')
+
+
 def print_header(text):
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 70}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.CYAN}  {text}{Colors.END}")
@@ -56,16 +90,16 @@ def abort(msg):
     sys.exit(1)
 
 
-def run(cmd, cwd=None, capture=False):
+def run(cmd, cwd=None, capture=False, env=None):
     """Ejecuta un comando"""
     try:
         if capture:
-            result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+            result = subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, text=True)
             if result.returncode != 0:
                 abort(f"Error ejecutando: {' '.join(cmd)}\n{result.stderr}")
             return result.stdout
         else:
-            result = subprocess.run(cmd, cwd=cwd)
+            result = subprocess.run(cmd, cwd=cwd, env=env)
             if result.returncode != 0:
                 abort(f"Error ejecutando: {' '.join(cmd)}")
     except Exception as e:
@@ -83,12 +117,22 @@ def check_requirements():
         'Git': ['git', '--version']
     }
 
-    missing = []
-    for name, cmd in requirements.items():
+    def is_installed(cmd):
         try:
-            subprocess.run(cmd, capture_output=True, check=True)
+            return subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL).returncode == 0
+        except OSError:
+            return False
+
+    # Las comprobaciones son independientes, así que se lanzan a la vez
+    with ThreadPoolExecutor(max_workers=len(requirements)) as executor:
+        results = list(executor.map(is_installed, requirements.values()))
+
+    missing = []
+    for name, installed in zip(requirements, results):
+        if installed:
             print_success(f"{name} instalado")
-        except:
+        else:
             print_error(f"{name} NO encontrado")
             missing.append(name)
 
@@ -143,6 +187,24 @@ def get_user_input():
             print_warning("Intenta nuevamente...\n")
             continue
 
+        if not os.path.isfile(workbench_file):
+            print_error(f"No es un archivo: {workbench_file}")
+            print_warning("Intenta nuevamente...\n")
+            continue
+
+        # Los .mwb son contenedores zip: validar la firma antes de la Fase 4
+        try:
+            with open(workbench_file, 'rb') as f:
+                magic = f.read(4)
+        except OSError as e:
+            print_error(f"No se pudo leer el archivo: {e}")
+            print_warning("Intenta nuevamente...\n")
+            continue
+        if magic[:2] != b'PK':
+            print_error("El archivo no es un modelo .mwb válido (no es un archivo comprimido de Workbench)")
+            print_warning("Intenta nuevamente...\n")
+            continue
+
         print_success("Archivo .mwb encontrado")
         break
 
@@ -157,6 +219,36 @@ def get_user_input():
     }
 
 
+def extract_project_zip(zip_path, dest_dir):
+    """Descomprime el proyecto base quitando la carpeta raíz común del zip"""
+    buffer_size = 1 << 20
+
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        infos = zip_ref.infolist()
+
+        # Si todo cuelga de una sola carpeta (p. ej. backend-repo-main/) se
+        # omite al extraer, así no hay que aplanar la estructura después
+        first = infos[0].filename.split('/')[0] + '/' if infos else ''
+        if first != '/' and all(info.filename.startswith(first) for info in infos):
+            root = first
+        else:
+            root = ''
+
+        for info in infos:
+            if info.is_dir():
+                continue
+
+            relative = info.filename[len(root):]
+            if os.path.isabs(relative) or '..' in relative.split('/'):
+                continue
+
+            target = os.path.join(dest_dir, relative)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, buffer_size)
+
+
 def setup_laravel_project(config):
     """Configura el proyecto Laravel con Docker"""
     print_header("FASE 1: CONFIGURANDO PROYECTO LARAVEL")
@@ -169,67 +261,62 @@ def setup_laravel_project(config):
     os.makedirs(project_name, exist_ok=True)
 
     print_info("Descomprimiendo proyecto base...")
-    with zipfile.ZipFile(ZIP_DEFAULT, 'r') as zip_ref:
-        zip_ref.extractall(project_name)
+    extract_project_zip(ZIP_DEFAULT, project_name)
     print_success("Proyecto descomprimido")
 
     os.chdir(project_name)
 
-    items = os.listdir(".")
-    folders = [f for f in items if os.path.isdir(f)]
-
-    if len(folders) == 1:
-        inner = folders[0]
-        print_info(f"Aplanando estructura desde {inner}/...")
-        for item in os.listdir(inner):
-            src = os.path.join(inner, item)
-            dst = item
-            if os.path.exists(dst):
-                if os.path.isdir(dst):
-                    shutil.rmtree(dst)
-                else:
-                    os.remove(dst)
-            shutil.move(src, dst)
-        shutil.rmtree(inner)
-
     if not os.path.exists("docker-compose.yml"):
         abort("No se encontró docker-compose.yml en el proyecto")
 
     print_info("Configurando docker-compose.yml...")
     with open("docker-compose.yml", "r") as f:
-        lines = f.readlines()
-
-    with open("docker-compose.yml", "w") as f:
-        for line in lines:
-            if "container_name" not in line:
-                f.write(line)
-
-    with open("docker-compose.yml", "r") as f:
-        content = f.read()
+        content = "".join(line for line in f if "container_name" not in line)
 
     content = content.replace("MYSQL_DATABASE: laravel_backend",
                               f"MYSQL_DATABASE: {db_name}")
     content = content.replace('"3306:3306"', f'"{db_port}:3306"')
 
+    # Usar la imagen de una ejecución previa como caché de capas; la imagen
+    # guarda su caché inline (BUILDKIT_INLINE_CACHE) para poder reutilizarse
+    content = re.sub(r"^([ \t]*)dockerfile: .*$",
+                     lambda m: (f"{m.group(0)}\n"
+                                f"{m.group(1)}cache_from:\n{m.group(1)}  - {project_name}-app\n"
+                                f"{m.group(1)}args:\n{m.group(1)}  BUILDKIT_INLINE_CACHE: \"1\""),
+                     content, count=1, flags=re.M)
+
+    # Healthcheck de MySQL para que `up --wait` sepa cuándo está listo
+    content = re.sub(r"^([ \t]*)image: mysql.*$",
+                     lambda m: m.group(0) + MYSQL_HEALTHCHECK.replace("{indent}", m.group(1)),
+                     content, count=1, flags=re.M)
+
     with open("docker-compose.yml", "w") as f:
         f.write(content)
 
+    if os.path.exists(APP_DOCKERFILE):
+        with open(APP_DOCKERFILE, "r") as f:
+            dockerfile = f.read()
+        if "BUILDKIT_INLINE_CACHE" not in dockerfile:
+            with open(APP_DOCKERFILE, "w") as f:
+                f.write("ARG BUILDKIT_INLINE_CACHE=1\n" + dockerfile)
+
     print_success("docker-compose.yml configurado")
 
     print_info("Configurando .env...")
     if not os.path.exists(".env.example"):
         abort("No existe .env.example en el proyecto")
 
-    shutil.copy(".env.example", ".env")
-
-    with open(".env", "r") as f:
+    with open(".env.example", "r") as f:
         env = f.read()
 
-    env = re.sub(r"DB_USERNAME=.*", "DB_USERNAME=laravel", env)
-    env = re.sub(r"DB_PASSWORD=.*", "DB_PASSWORD=root", env)
-    env = re.sub(r"DB_DATABASE=.*", f"DB_DATABASE={db_name}", env)
-    env = re.sub(r"DB_HOST=.*", "DB_HOST=db", env)
-    env = re.sub(r"DB_PORT=.*", "DB_PORT=3306", env)
+    env_values = {
+        'DB_USERNAME': 'laravel',
+        'DB_PASSWORD': 'root',
+        'DB_DATABASE': db_name,
+        'DB_HOST': 'db',
+        'DB_PORT': '3306',
+    }
+    env = ENV_DB_RE.sub(lambda m: f"{m.group(1)}={env_values[m.group(1)]}", env)
 
     with open(".env", "w") as f:
         f.write(env)
@@ -239,6 +326,25 @@ def setup_laravel_project(config):
     return os.getcwd()
 
 
+@dataclass
+class Containers:
+    """IDs de los contenedores del proyecto, resueltos una sola vez"""
+    app: str
+    db: str
+
+
+def get_container_id(project_name, service):
+    """Obtiene el ID del contenedor de un servicio de docker compose"""
+    result = subprocess.check_output(
+        ["docker", "compose", "-p", project_name, "ps", "-q", service]
+    ).decode().strip()
+
+    if not result:
+        abort(f"No se encontró el contenedor {service}")
+
+    return result
+
+
 def start_docker_containers(config):
     """Inicia los contenedores Docker"""
     print_header("FASE 2: INICIANDO CONTENEDORES DOCKER")
@@ -246,63 +352,27 @@ def start_docker_containers(config):
     project_name = config['project_name']
     db_name = config['db_name']
 
-    print_info("Construyendo y levantando contenedores...")
-    run(["docker", "compose", "-p", project_name, "up", "-d", "--build"])
-    print_success("Contenedores iniciados")
+    print_info("Construyendo y levantando contenedores (esperando que MySQL esté listo)...")
+    run(["docker", "compose", "-p", project_name, "up", "-d", "--build", "--wait"],
+        env=DOCKER_BUILD_ENV)
+    print_success("Contenedores iniciados y MySQL está listo")
 
-    print_info("Esperando que MySQL esté listo...")
-    max_attempts = 30
-    attempt = 0
-
-    while attempt < max_attempts:
-        try:
-            result = subprocess.run(
-                ["docker", "compose", "-p", project_name, "exec", "-T", "db",
-                 "mysqladmin", "ping", "-h", "localhost", "-uroot", "-proot"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5
-            )
-            if b"mysqld is alive" in result.stdout:
-                break
-        except:
-            pass
-
-        attempt += 1
-        time.sleep(2)
-        print(f"  Intento {attempt}/{max_attempts}...", end='\r')
-
-    if attempt >= max_attempts:
-        abort("MySQL no respondió después de 60 segundos")
-
-    print_success("MySQL está listo                    ")
-
-    print_info("Creando base de datos...")
-    run([
-        "docker", "compose", "-p", project_name,
-        "exec", "-T", "db",
-        "mysql", "-uroot", "-proot",
-        "-e", f"CREATE DATABASE IF NOT EXISTS {db_name};"
-    ])
+    containers = Containers(
+        app=get_container_id(project_name, "app"),
+        db=get_container_id(project_name, "db"),
+    )
 
-    print_info("Configurando permisos...")
+    print_info("Creando base de datos y configurando permisos...")
     run([
-        "docker", "compose", "-p", project_name,
-        "exec", "-T", "db",
+        "docker", "exec", containers.db,
         "mysql", "-uroot", "-proot",
-        "-e", f"GRANT ALL PRIVILEGES ON {db_name}.* TO 'laravel'@'%'; FLUSH PRIVILEGES;"
+        "-e", f"CREATE DATABASE IF NOT EXISTS {db_name}; "
+              f"GRANT ALL PRIVILEGES ON {db_name}.* TO 'laravel'@'%'; FLUSH PRIVILEGES;"
     ])
 
     print_success("Base de datos configurada")
 
-    result = subprocess.check_output(
-        ["docker", "compose", "-p", project_name, "ps", "-q", "app"]
-    ).decode().strip()
-
-    if not result:
-        abort("No se encontró el contenedor app")
-
-    return result
+    return containers
 
 
 def setup_laravel_app(config, app_container):
@@ -310,18 +380,87 @@ def setup_laravel_app(config, app_container):
     print_header("FASE 3: CONFIGURANDO APLICACIÓN LARAVEL")
 
     print_info("Instalando dependencias con Composer...")
-    run(["docker", "exec", app_container, "composer", "update"])
-    print_success("Dependencias instaladas")
-
     print_info("Generando APP_KEY...")
-    run(["docker", "exec", app_container, "php", "artisan", "key:generate"])
-
     print_info("Generando JWT_SECRET...")
-    run(["docker", "exec", app_container, "php", "artisan", "jwt:secret"])
+    run(["docker", "exec", app_container, "sh", "-c",
+         "composer update --no-interaction && php artisan key:generate && php artisan jwt:secret"])
+    print_success("Dependencias instaladas")
 
     print_success("Claves generadas")
 
 
+def copy_generated_files(src_dir, dst_dir):
+    """Mueve los archivos generados a su destino y devuelve cuántos fueron"""
+    entries = [e for e in os.scandir(src_dir) if e.is_file()]
+    os.makedirs(dst_dir, exist_ok=True)
+
+    def move_one(entry):
+        dst_file = os.path.join(dst_dir, entry.name)
+        # Mismo sistema de archivos: basta un rename
+        try:
+            os.replace(entry.path, dst_file)
+        except OSError:
+            shutil.copyfile(entry.path, dst_file)
+
+    # Las copias son I/O puro, así que se solapan en varios hilos
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(move_one, entries))
+
+    return len(entries)
+
+
+def watch_generated_files(temp_output, project_path, stop_event, moved):
+    """Mueve al proyecto los archivos que el generador ya escribió, mientras sigue corriendo"""
+    # Directorios destino creados una sola vez; si falla, ese directorio
+    # queda para la copia final
+    pending = {}
+    for sub, dst in EARLY_COPY_DIRS.items():
+        dst_dir = os.path.join(project_path, dst)
+        try:
+            os.makedirs(dst_dir, exist_ok=True)
+        except OSError as e:
+            print_warning(f"No se pudo crear {dst}: {e}")
+            continue
+        pending[sub] = dst_dir
+
+    while pending and not stop_event.wait(WATCH_INTERVAL):
+        for sub, dst_dir in list(pending.items()):
+            try:
+                entries = [e for e in os.scandir(os.path.join(temp_output, sub)) if e.is_file()]
+            except FileNotFoundError:
+                # El generador aún no crea este directorio
+                continue
+            except OSError as e:
+                print_warning(f"No se pudo leer {sub}: {e}")
+                del pending[sub]
+                continue
+
+            for entry in entries:
+                try:
+                    os.replace(entry.path, os.path.join(dst_dir, entry.name))
+                    moved[sub] += 1
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    # Otro sistema de archivos (EXDEV) u otro error: no se
+                    # reintenta en cada sondeo, lo recoge la copia final
+                    if e.errno != errno.EXDEV:
+                        print_warning(f"No se pudo mover {entry.name}: {e}")
+                    del pending[sub]
+                    break
+
+
+@contextmanager
+def working_directory(path):
+    """Cambia temporalmente de directorio y siempre restaura el anterior"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
 def generate_backend_from_workbench(config, project_path, app_container):
     """Genera el backend desde el modelo de Workbench"""
     if not config.get('workbench_file'):
@@ -333,21 +472,37 @@ def generate_backend_from_workbench(config, project_path, app_container):
     workbench_file = config['workbench_file']
     temp_output = "/tmp/laravel_generated"
 
-    original_dir = Path(__file__).parent.absolute()
-
     print_info(f"Generando backend desde {Path(workbench_file).name}...")
 
+    # Evitar que el watcher recoja archivos de una ejecución anterior
+    if os.path.exists(temp_output):
+        shutil.rmtree(temp_output)
+
+    moved = {sub: 0 for sub in EARLY_COPY_DIRS}
+    stop_watching = threading.Event()
+    watcher = threading.Thread(
+        target=watch_generated_files,
+        args=(temp_output, project_path, stop_watching, moved),
+        daemon=True
+    )
+
     try:
-        os.chdir(original_dir)
-        run([
-            "python3", GENERATOR_SCRIPT,
-            workbench_file,
-            temp_output
-        ])
+        with working_directory(ORIGINAL_DIR):
+            watcher.start()
+            generator = subprocess.Popen([
+                "python3", GENERATOR_SCRIPT,
+                workbench_file,
+                temp_output
+            ])
+            returncode = generator.wait()
+            stop_watching.set()
+            watcher.join()
+        if returncode != 0:
+            abort(f"Error ejecutando: python3 {GENERATOR_SCRIPT} {workbench_file} {temp_output}")
         print_success("Backend generado exitosamente")
     except Exception as e:
+        stop_watching.set()
         print_error(f"Error generando backend: {e}")
-        os.chdir(project_path)
         return False
 
     os.chdir(project_path)
@@ -359,35 +514,24 @@ def generate_backend_from_workbench(config, project_path, app_container):
     migrations_dst = "database/migrations"
 
     if os.path.exists(migrations_src):
-        for file in os.listdir(migrations_src):
-            src_file = os.path.join(migrations_src, file)
-            dst_file = os.path.join(migrations_dst, file)
-            shutil.copy2(src_file, dst_file)
-        print_success(f"✓ Migraciones copiadas ({len(os.listdir(migrations_src))} archivos)")
+        copied = moved["migrations"] + copy_generated_files(migrations_src, migrations_dst)
+        print_success(f"✓ Migraciones copiadas ({copied} archivos)")
 
     # ── Modelos ───────────────────────────────────────────────────────────────
     models_src = os.path.join(temp_output, "models")
     models_dst = "app/Models"
 
     if os.path.exists(models_src):
-        os.makedirs(models_dst, exist_ok=True)
-        for file in os.listdir(models_src):
-            src_file = os.path.join(models_src, file)
-            dst_file = os.path.join(models_dst, file)
-            shutil.copy2(src_file, dst_file)
-        print_success(f"✓ Modelos copiados ({len(os.listdir(models_src))} archivos)")
+        copied = moved["models"] + copy_generated_files(models_src, models_dst)
+        print_success(f"✓ Modelos copiados ({copied} archivos)")
 
     # ── Controladores ─────────────────────────────────────────────────────────
     controllers_src = os.path.join(temp_output, "controllers")
     controllers_dst = "app/Http/Controllers/Api"
 
     if os.path.exists(controllers_src):
-        os.makedirs(controllers_dst, exist_ok=True)
-        for file in os.listdir(controllers_src):
-            src_file = os.path.join(controllers_src, file)
-            dst_file = os.path.join(controllers_dst, file)
-            shutil.copy2(src_file, dst_file)
-        print_success(f"✓ Controladores copiados ({len(os.listdir(controllers_src))} archivos)")
+        copied = moved["controllers"] + copy_generated_files(controllers_src, controllers_dst)
+        print_success(f"✓ Controladores copiados ({copied} archivos)")
 
     # ── Seeders ───────────────────────────────────────────────────────────────
     seeders_src = os.path.join(temp_output, "seeders")
@@ -419,19 +563,15 @@ def generate_backend_from_workbench(config, project_path, app_container):
     routes_dst = "routes/api.php"
 
     if os.path.exists(routes_src):
-        with open(routes_src, 'r') as f:
-            new_routes = f.read()
-
-        with open(routes_dst, 'r') as f:
-            existing_routes = f.read()
-
-        lines = new_routes.split('\n')
-        route_lines = [line for line in lines if line.strip().startswith('Route::')]
-
-        if route_lines:
-            with open(routes_dst, 'a') as f:
-                f.write("\n\n// Rutas generadas automáticamente\n")
-                f.write('\n'.join(route_lines))
+        with open(routes_src, 'r') as src, open(routes_dst, 'a') as dst:
+            header_written = False
+            for line in src:
+                if not line.lstrip().startswith('Route::'):
+                    continue
+                if not header_written:
+                    dst.write("\n\n// Rutas generadas automáticamente\n")
+                    header_written = True
+                dst.write(line)
 
         print_success(f"✓ Rutas agregadas")
 
@@ -591,9 +731,9 @@ def main():
             sys.exit(0)
 
         project_path = setup_laravel_project(config)
-        app_container = start_docker_containers(config)
-        setup_laravel_app(config, app_container)
-        backend_generated = generate_backend_from_workbench(config, project_path, app_container)
+        containers = start_docker_containers(config)
+        setup_laravel_app(config, containers.app)
+        backend_generated = generate_backend_from_workbench(config, project_path, containers.app)
         initialize_git_repo(config, project_path)
         print_final_summary(config, backend_generated)
 
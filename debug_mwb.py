@@ -10,6 +10,15 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from laravel_generator import WorkbenchParser
 
 
+# Tipos MySQL que el generador sabe mapear
+VALID_TYPES = frozenset({
+    'int', 'integer', 'tinyint', 'smallint', 'mediumint', 'bigint',
+    'varchar', 'char', 'text', 'mediumtext', 'longtext',
+    'decimal', 'float', 'double', 'boolean', 'bool',
+    'date', 'datetime', 'timestamp', 'time', 'year', 'json', 'enum',
+})
+
+
 def debug_mwb_file(mwb_file: str):
     """Parsea y muestra información detallada del archivo .mwb"""
     
@@ -31,27 +40,31 @@ def debug_mwb_file(mwb_file: str):
     print(f"Tablas encontradas: {len(parser.tables)}")
     print(f"Relaciones encontradas: {len(parser.relationships)}\n")
     
-    # Mostrar detalles de cada tabla
+    # Mostrar detalles de cada tabla (una sola escritura por tabla)
+    buf = []
     for table in parser.tables:
-        print(f"\n{'─' * 70}")
-        print(f"📊 TABLA: {table['name']}")
-        print(f"{'─' * 70}")
-        print(f"Columnas: {len(table['columns'])}")
-        print(f"Soft Deletes: {'Sí' if table['has_soft_deletes'] else 'No'}")
-        print(f"\nDetalle de columnas:\n")
+        buf.append(f"\n{'─' * 70}\n")
+        buf.append(f"📊 TABLA: {table['name']}\n")
+        buf.append(f"{'─' * 70}\n")
+        buf.append(f"Columnas: {len(table['columns'])}\n")
+        buf.append(f"Soft Deletes: {'Sí' if table['has_soft_deletes'] else 'No'}\n")
+        buf.append(f"\nDetalle de columnas:\n\n")
         
         for col in table['columns']:
             # Mostrar información completa
-            print(f"  • {col['name']}")
-            print(f"    ├─ Tipo: {col['type']}")
-            print(f"    ├─ Longitud: {col['length'] if col['length'] else 'N/A'}")
-            print(f"    ├─ Precisión: {col['precision'] if col['precision'] else 'N/A'}")
-            print(f"    ├─ Escala: {col['scale'] if col['scale'] else 'N/A'}")
-            print(f"    ├─ NOT NULL: {'Sí' if col['not_null'] else 'No'}")
-            print(f"    ├─ Auto Increment: {'Sí' if col['auto_increment'] else 'No'}")
-            print(f"    ├─ Default: {col['default'] if col['default'] else 'N/A'}")
-            print(f"    └─ Comentario: {col['comment'] if col['comment'] else 'N/A'}")
-            print()
+            buf.append(f"  • {col['name']}\n")
+            buf.append(f"    ├─ Tipo: {col['type']}\n")
+            buf.append(f"    ├─ Longitud: {col['length'] if col['length'] else 'N/A'}\n")
+            buf.append(f"    ├─ Precisión: {col['precision'] if col['precision'] else 'N/A'}\n")
+            buf.append(f"    ├─ Escala: {col['scale'] if col['scale'] else 'N/A'}\n")
+            buf.append(f"    ├─ NOT NULL: {'Sí' if col['not_null'] else 'No'}\n")
+            buf.append(f"    ├─ Auto Increment: {'Sí' if col['auto_increment'] else 'No'}\n")
+            buf.append(f"    ├─ Default: {col['default'] if col['default'] else 'N/A'}\n")
+            buf.append(f"    └─ Comentario: {col['comment'] if col['comment'] else 'N/A'}\n")
+            buf.append("\n")
+
+        sys.stdout.write("".join(buf))
+        buf.clear()
     
     # Mostrar relaciones
     if parser.relationships:
@@ -65,11 +78,14 @@ def debug_mwb_file(mwb_file: str):
             source_cols = ', '.join(rel['source_columns'])
             target_cols = ', '.join(rel['target_columns'])
             
-            print(f"  • {source}.{source_cols} → {target}.{target_cols}")
-            print(f"    ├─ Nombre: {rel['name']}")
-            print(f"    ├─ ON DELETE: {rel['on_delete']}")
-            print(f"    └─ ON UPDATE: {rel['on_update']}")
-            print()
+            buf.append(f"  • {source}.{source_cols} → {target}.{target_cols}\n")
+            buf.append(f"    ├─ Nombre: {rel['name']}\n")
+            buf.append(f"    ├─ ON DELETE: {rel['on_delete']}\n")
+            buf.append(f"    └─ ON UPDATE: {rel['on_update']}\n")
+            buf.append("\n")
+
+        sys.stdout.write("".join(buf))
+        buf.clear()
     
     # Detectar problemas comunes
     print(f"\n{'─' * 70}")
@@ -89,32 +105,26 @@ def debug_mwb_file(mwb_file: str):
                     problems.append(f"❌ {table['name']}.{col['name']}: Longitud negativa {length} (se usará 255)")
             
             # Problema 2: Tipo desconocido
-            valid_types = ['int', 'integer', 'tinyint', 'smallint', 'mediumint', 'bigint',
-                          'varchar', 'char', 'text', 'mediumtext', 'longtext',
-                          'decimal', 'float', 'double', 'boolean', 'bool',
-                          'date', 'datetime', 'timestamp', 'time', 'year', 'json', 'enum']
-            
-            base_type = col['type'].lower().split('(')[0].strip()
-            if base_type not in valid_types:
+            # Mismo tipo base que usa el generador: "int unsigned" no se mapea
+            if col['_base_type'] not in VALID_TYPES:
                 problems.append(f"⚠️  {table['name']}.{col['name']}: Tipo '{col['type']}' no reconocido (se usará string)")
     
     # Problema 3: FK sin relación
+    fk_columns = {
+        (rel['source_table'], source_col)
+        for rel in parser.relationships
+        for source_col in rel['source_columns']
+    }
+
     for table in parser.tables:
         for col in table['columns']:
             if col['name'].endswith('_id') and col['name'] != 'id':
                 # Verificar si hay relación
-                has_relation = False
-                for rel in parser.relationships:
-                    if rel['source_table'] == table['name'] and col['name'] in rel['source_columns']:
-                        has_relation = True
-                        break
-                
-                if not has_relation:
+                if (table['name'], col['name']) not in fk_columns:
                     problems.append(f"⚠️  {table['name']}.{col['name']}: Parece FK pero no tiene relación definida")
     
     if problems:
-        for problem in problems:
-            print(f"  {problem}")
+        sys.stdout.write("".join(f"  {problem}\n" for problem in problems))
     else:
         print("  ✅ No se detectaron problemas")
     
@@ -4,14 +4,109 @@ Utilidades y helpers para el generador Laravel
 Funciones auxiliares para conversión de nombres, validación, etc.
 """
 
+import logging
+import os
 import re
-from typing import Dict, List, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from string import ascii_letters, digits
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_log = logging.getLogger(__name__)
+
+
+# Expresiones regulares precompiladas
+_SEP_RE = re.compile(r'[-_\s]+')
+# Límites de palabra para snake_case: minúscula/dígito → Mayúscula,
+# acrónimo → Palabra (HTTPServer → HTTP_Server) y guiones
+_SNAKE_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|-')
+# kebab-case reutiliza los límites de snake_case y cambia '_' por '-'
+_KEBAB_TABLE = str.maketrans('_', '-')
+_PHP_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Tabla para borrar con str.translate todo ASCII que no sea [a-zA-Z0-9_]
+_PHP_VALID_CHARS = frozenset(ascii_letters + digits + '_')
+_PHP_DELETE_TABLE = {c: None for c in range(128) if chr(c) not in _PHP_VALID_CHARS}
+
+# Plurales irregulares en inglés (y su inverso)
+_PLURAL_IRREGULARS = {
+    'person': 'people',
+    'man': 'men',
+    'woman': 'women',
+    'child': 'children',
+    'tooth': 'teeth',
+    'foot': 'feet',
+    'mouse': 'mice',
+    'goose': 'geese',
+}
+_SINGULAR_IRREGULARS = {plural: singular for singular, plural in _PLURAL_IRREGULARS.items()}
+
+_VOWELS = frozenset('aeiou')
+
+# Sufijo -> (caracteres a quitar, reemplazo)
+_PLURAL_SUFFIX_RULES = {
+    'ch': (0, 'es'),
+    'sh': (0, 'es'),
+    'fe': (2, 'ves'),
+    's': (0, 'es'),
+    'x': (0, 'es'),
+    'z': (0, 'es'),
+    'f': (1, 'ves'),
+}
+
+# Sufijo -> (caracteres a quitar, reemplazo, largo mínimo de la palabra)
+_SINGULAR_SUFFIX_RULES = {
+    'ches': (2, '', 4),
+    'shes': (2, '', 4),
+    'ies': (3, 'y', 4),
+    'ves': (3, 'f', 3),
+    'ses': (2, '', 3),
+    'xes': (2, '', 3),
+    'zes': (2, '', 3),
+}
+
+# Marca de fin de sufijo dentro del trie; no es un str para que ningún
+# carácter de la palabra (p. ej. '$' en identificadores MySQL) la pise
+_RULE_KEY = object()
+
+
+def _build_suffix_trie(rules: Dict[str, tuple]) -> Dict:
+    """Construye un trie de sufijos leídos de derecha a izquierda"""
+    trie = {}
+    for suffix, rule in rules.items():
+        node = trie
+        for char in reversed(suffix):
+            node = node.setdefault(char, {})
+        node[_RULE_KEY] = rule
+    return trie
+
+
+def _match_suffix(trie: Dict, word: str) -> Optional[tuple]:
+    """Devuelve la regla del sufijo más largo de la palabra presente en el trie"""
+    node = trie
+    rule = None
+    for char in reversed(word):
+        node = node.get(char)
+        if node is None:
+            break
+        rule = node.get(_RULE_KEY, rule)
+    return rule
+
+
+_PLURAL_SUFFIX_TRIE = _build_suffix_trie(_PLURAL_SUFFIX_RULES)
+_SINGULAR_SUFFIX_TRIE = _build_suffix_trie(_SINGULAR_SUFFIX_RULES)
 
 
 class NamingHelper:
-    """Helper para conversión de nombres entre diferentes convenciones"""
+    """Helper para conversión de nombres entre diferentes convenciones
+
+    Las conversiones se memorizan: son funciones puras y un mismo
+    nombre repetido se resuelve desde la caché.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def to_studly_case(string: str) -> str:
         """Convierte a StudlyCase/PascalCase
         
@@ -20,12 +115,16 @@ class NamingHelper:
             blog-posts -> BlogPosts
             user posts -> UserPosts
         """
+        # Ya está en StudlyCase de una sola palabra (p. ej. "Cliente")
+        if string.isalnum() and string[0].isupper() and string[1:].islower():
+            return string
         # Reemplazar separadores con espacios
-        string = re.sub(r'[-_\s]+', ' ', string)
+        string = _SEP_RE.sub(' ', string)
         # Capitalizar cada palabra y juntar
-        return ''.join(word.capitalize() for word in string.split())
+        return ''.join([word.capitalize() for word in string.split()])
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def to_camel_case(string: str) -> str:
         """Convierte a camelCase
         
@@ -38,6 +137,7 @@ class NamingHelper:
         return studly[0].lower() + studly[1:] if studly else ''
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def to_snake_case(string: str) -> str:
         """Convierte a snake_case
         
@@ -46,14 +146,14 @@ class NamingHelper:
             blogPosts -> blog_posts
             user-posts -> user_posts
         """
-        # Insertar guión bajo antes de mayúsculas
-        string = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', string)
-        string = re.sub('([a-z0-9])([A-Z])', r'\1_\2', string)
-        # Reemplazar guiones con guiones bajos
-        string = string.replace('-', '_')
-        return string.lower()
+        # Ya está en minúsculas y sin guiones: no hay nada que convertir
+        if string.islower() and '-' not in string:
+            return string
+        # Insertar guión bajo en cada límite (y en lugar de guiones) en una pasada
+        return _SNAKE_RE.sub('_', string).lower()
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def to_kebab_case(string: str) -> str:
         """Convierte a kebab-case
         
@@ -62,9 +162,12 @@ class NamingHelper:
             user_posts -> user-posts
             blogPosts -> blog-posts
         """
-        return NamingHelper.to_snake_case(string).replace('_', '-')
+        if string.islower() and '_' not in string:
+            return string
+        return _SNAKE_RE.sub('-', string).lower().translate(_KEBAB_TABLE)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def to_plural(word: str) -> str:
         """Pluraliza una palabra en inglés (reglas básicas)
         
@@ -74,40 +177,25 @@ class NamingHelper:
             category -> categories
             company -> companies
         """
-        # Reglas especiales
-        irregulars = {
-            'person': 'people',
-            'man': 'men',
-            'woman': 'women',
-            'child': 'children',
-            'tooth': 'teeth',
-            'foot': 'feet',
-            'mouse': 'mice',
-            'goose': 'geese',
-        }
-        
         word_lower = word.lower()
-        if word_lower in irregulars:
-            return irregulars[word_lower]
+        if word_lower in _PLURAL_IRREGULARS:
+            return _PLURAL_IRREGULARS[word_lower]
         
         # Termina en y precedida de consonante
-        if word.endswith('y') and len(word) > 1 and word[-2] not in 'aeiou':
+        if word.endswith('y') and len(word) > 1 and word[-2].lower() not in _VOWELS:
             return word[:-1] + 'ies'
         
-        # Termina en s, x, z, ch, sh
-        if word.endswith(('s', 'ss', 'x', 'z', 'ch', 'sh')):
-            return word + 'es'
-        
-        # Termina en f o fe
-        if word.endswith('f'):
-            return word[:-1] + 'ves'
-        if word.endswith('fe'):
-            return word[:-2] + 'ves'
+        # Termina en s, x, z, ch, sh, f o fe
+        rule = _match_suffix(_PLURAL_SUFFIX_TRIE, word)
+        if rule:
+            strip, replacement = rule
+            return word[:len(word) - strip] + replacement
         
         # Regla por defecto
         return word + 's'
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def to_singular(word: str) -> str:
         """Singulariza una palabra en inglés (reglas básicas)
         
@@ -117,33 +205,15 @@ class NamingHelper:
             categories -> category
             companies -> company
         """
-        # Reglas especiales inversas
-        irregulars = {
-            'people': 'person',
-            'men': 'man',
-            'women': 'woman',
-            'children': 'child',
-            'teeth': 'tooth',
-            'feet': 'foot',
-            'mice': 'mouse',
-            'geese': 'goose',
-        }
-        
         word_lower = word.lower()
-        if word_lower in irregulars:
-            return irregulars[word_lower]
-        
-        # Termina en ies
-        if word.endswith('ies') and len(word) > 3:
-            return word[:-3] + 'y'
-        
-        # Termina en ves
-        if word.endswith('ves'):
-            return word[:-3] + 'f'
+        if word_lower in _SINGULAR_IRREGULARS:
+            return _SINGULAR_IRREGULARS[word_lower]
         
-        # Termina en ses, xes, zes, ches, shes
-        if word.endswith(('ses', 'xes', 'zes', 'ches', 'shes')):
-            return word[:-2]
+        # Termina en ies, ves, ses, xes, zes, ches o shes
+        rule = _match_suffix(_SINGULAR_SUFFIX_TRIE, word)
+        if rule and len(word) >= rule[2]:
+            strip, replacement, _ = rule
+            return word[:-strip] + replacement
         
         # Termina en s
         if word.endswith('s') and len(word) > 1:
@@ -152,6 +222,11 @@ class NamingHelper:
         return word
 
 
+# Reglas de validación ya generadas, por (tipo, longitud, not_null, destino FK)
+_VALIDATION_CACHE: Dict[tuple, str] = {}
+_VALIDATION_CACHE_SIZE = 8192
+
+
 class ValidationHelper:
     """Helper para generar reglas de validación"""
     
@@ -178,8 +253,41 @@ class ValidationHelper:
     }
     
     @staticmethod
-    def get_validation_rule(column: Dict, relationships: List[Dict] = None) -> str:
-        """Genera regla de validación para una columna"""
+    def build_fk_index(relationships: List[Dict]) -> Dict[str, Dict]:
+        """Indexa las relaciones por columna origen (gana la primera, como en el scan lineal)"""
+        fk_index = {}
+        for rel in relationships:
+            for source_col in rel.get('source_columns', []):
+                fk_index.setdefault(source_col, rel)
+        return fk_index
+    
+    @staticmethod
+    def get_validation_rule(column: Dict, relationships: List[Dict] = None,
+                            fk_index: Dict[str, Dict] = None) -> str:
+        """Genera regla de validación para una columna
+
+        Para validar muchas columnas conviene construir fk_index una vez con
+        build_fk_index() y pasarlo en cada llamada en lugar de relationships.
+        Si la columna trae '_type_lower' (lo rellena el parser) se usa tal cual.
+        """
+        col_type = column.get('_type_lower') or column['type'].lower()
+        
+        # Foreign key validation
+        if fk_index is None and relationships:
+            fk_index = ValidationHelper.build_fk_index(relationships)
+        
+        rel = fk_index.get(column['name']) if fk_index else None
+        fk_target = None
+        if rel:
+            target_col = rel['target_columns'][0] if rel['target_columns'] else 'id'
+            fk_target = (rel['target_table'], target_col)
+        
+        # Columnas con la misma forma comparten la misma regla
+        key = (col_type, column['length'], column['not_null'], fk_target)
+        cached = _VALIDATION_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
         rules = []
         
         # Required/Nullable
@@ -189,24 +297,35 @@ class ValidationHelper:
             rules.append('nullable')
         
         # Tipo
-        col_type = column['type'].lower()
         if col_type in ValidationHelper.TYPE_RULES:
             rules.append(ValidationHelper.TYPE_RULES[col_type])
         
         # Longitud para strings
-        if col_type in ['varchar', 'char'] and column['length']:
+        if col_type in ('varchar', 'char') and column['length']:
             rules.append(f"max:{column['length']}")
         
-        # Foreign key validation
-        if relationships:
-            for rel in relationships:
-                if column['name'] in rel.get('source_columns', []):
-                    target_table = rel['target_table']
-                    target_col = rel['target_columns'][0] if rel['target_columns'] else 'id'
-                    rules.append(f"exists:{target_table},{target_col}")
-                    break
+        if fk_target:
+            rules.append(f"exists:{fk_target[0]},{fk_target[1]}")
         
-        return '|'.join(rules)
+        rule = '|'.join(rules)
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+            _VALIDATION_CACHE.clear()
+        _VALIDATION_CACHE[key] = rule
+        return rule
+
+
+# Plantillas de docblock, se completan con str.format
+_CLASS_DOCBLOCK_TEMPLATE = """/**
+ * {}
+ *
+ * @package App\\Models
+ */"""
+
+_PROPERTY_DOCBLOCK_TEMPLATE = """    /**
+     * {}
+     *
+     * @var {}
+     */"""
 
 
 class DocblockHelper:
@@ -215,29 +334,17 @@ class DocblockHelper:
     @staticmethod
     def generate_class_docblock(class_name: str, description: str = None) -> str:
         """Genera docblock para una clase"""
-        desc = description or f"{class_name} model"
-        return f"""/**
- * {desc}
- *
- * @package App\\Models
- */"""
+        return _CLASS_DOCBLOCK_TEMPLATE.format(description if description else class_name + " model")
     
     @staticmethod
     def generate_method_docblock(method_name: str, params: List[Dict] = None, 
                                  return_type: str = None, description: str = None) -> str:
         """Genera docblock para un método"""
-        lines = ["/**"]
-        
-        if description:
-            lines.append(f" * {description}")
-            lines.append(" *")
+        lines = [f"/**\n * {description}\n *" if description else "/**"]
         
         if params:
-            for param in params:
-                param_type = param.get('type', 'mixed')
-                param_name = param.get('name', '')
-                param_desc = param.get('description', '')
-                lines.append(f" * @param {param_type} ${param_name} {param_desc}")
+            lines.extend([f" * @param {param.get('type', 'mixed')} ${param.get('name', '')} "
+                          f"{param.get('description', '')}" for param in params])
         
         if return_type:
             lines.append(f" * @return {return_type}")
@@ -249,101 +356,77 @@ class DocblockHelper:
     def generate_property_docblock(property_name: str, prop_type: str, 
                                    description: str = None) -> str:
         """Genera docblock para una propiedad"""
-        desc = description or f"The {property_name}"
-        return f"""    /**
-     * {desc}
-     *
-     * @var {prop_type}
-     */"""
+        return _PROPERTY_DOCBLOCK_TEMPLATE.format(
+            description if description else "The " + property_name, prop_type)
 
 
 class TypeMapper:
     """Helper para mapeo de tipos entre diferentes sistemas"""
     
-    MYSQL_TO_LARAVEL = {
-        'int': 'integer',
-        'tinyint': 'tinyInteger',
-        'smallint': 'smallInteger',
-        'mediumint': 'mediumInteger',
-        'bigint': 'bigInteger',
-        'varchar': 'string',
-        'char': 'char',
-        'text': 'text',
-        'mediumtext': 'mediumText',
-        'longtext': 'longText',
-        'decimal': 'decimal',
-        'float': 'float',
-        'double': 'double',
-        'boolean': 'boolean',
-        'tinyint(1)': 'boolean',
-        'date': 'date',
-        'datetime': 'dateTime',
-        'timestamp': 'timestamp',
-        'time': 'time',
-        'year': 'year',
-        'json': 'json',
-        'enum': 'enum',
-        'blob': 'binary',
-    }
+    # tipo MySQL -> (tipo de migración Laravel, tipo PHP, cast de Eloquent)
+    TYPE_TABLE = {sys.intern(key): value for key, value in {
+        'int': ('integer', 'int', 'integer'),
+        'tinyint': ('tinyInteger', 'int', 'integer'),
+        'smallint': ('smallInteger', 'int', 'integer'),
+        'mediumint': ('mediumInteger', 'int', 'integer'),
+        'bigint': ('bigInteger', 'int', 'integer'),
+        'varchar': ('string', 'string', None),
+        'char': ('char', 'string', None),
+        'text': ('text', 'string', None),
+        'mediumtext': ('mediumText', 'string', None),
+        'longtext': ('longText', 'string', None),
+        'decimal': ('decimal', 'float', 'decimal:2'),
+        'float': ('float', 'float', 'float'),
+        'double': ('double', 'float', 'double'),
+        'boolean': ('boolean', 'bool', 'boolean'),
+        'tinyint(1)': ('boolean', 'bool', 'boolean'),
+        'date': ('date', 'string', 'date'),
+        'datetime': ('dateTime', 'string', 'datetime'),
+        'timestamp': ('timestamp', 'string', 'datetime'),
+        'time': ('time', 'string', None),
+        'year': ('year', 'mixed', None),
+        'json': ('json', 'array', 'array'),
+        'enum': ('enum', 'mixed', None),
+        'blob': ('binary', 'mixed', None),
+    }.items()}
     
-    MYSQL_TO_PHP = {
-        'int': 'int',
-        'tinyint': 'int',
-        'smallint': 'int',
-        'mediumint': 'int',
-        'bigint': 'int',
-        'varchar': 'string',
-        'char': 'string',
-        'text': 'string',
-        'mediumtext': 'string',
-        'longtext': 'string',
-        'decimal': 'float',
-        'float': 'float',
-        'double': 'float',
-        'boolean': 'bool',
-        'tinyint(1)': 'bool',
-        'date': 'string',
-        'datetime': 'string',
-        'timestamp': 'string',
-        'time': 'string',
-        'json': 'array',
-    }
+    DEFAULT_TYPES = ('string', 'mixed', None)
+    
+    # Vistas por faceta, se mantienen por compatibilidad
+    MYSQL_TO_LARAVEL = {key: value[0] for key, value in TYPE_TABLE.items()}
+    MYSQL_TO_PHP = {key: value[1] for key, value in TYPE_TABLE.items()
+                    if value[1] != 'mixed'}
+    CAST_MAP = {key: value[2] for key, value in TYPE_TABLE.items()
+                if value[2] is not None}
+    
+    @staticmethod
+    def get_all(mysql_type: str) -> Tuple[str, str, Optional[str]]:
+        """Devuelve (tipo Laravel, tipo PHP, cast) con una sola búsqueda"""
+        # Camino rápido: el tipo ya viene normalizado
+        entry = TypeMapper.TYPE_TABLE.get(mysql_type)
+        if entry is not None:
+            return entry
+        return TypeMapper.TYPE_TABLE.get(mysql_type.lower().strip(),
+                                         TypeMapper.DEFAULT_TYPES)
     
     @staticmethod
     def mysql_to_laravel(mysql_type: str) -> str:
         """Convierte tipo MySQL a tipo de migración Laravel"""
-        mysql_type = mysql_type.lower().strip()
-        return TypeMapper.MYSQL_TO_LARAVEL.get(mysql_type, 'string')
+        return TypeMapper.get_all(mysql_type)[0]
     
     @staticmethod
     def mysql_to_php(mysql_type: str) -> str:
         """Convierte tipo MySQL a tipo PHP"""
-        mysql_type = mysql_type.lower().strip()
-        return TypeMapper.MYSQL_TO_PHP.get(mysql_type, 'mixed')
+        return TypeMapper.get_all(mysql_type)[1]
     
     @staticmethod
     def should_cast(column: Dict) -> Optional[str]:
         """Determina si una columna debe tener cast y de qué tipo"""
-        col_type = column['type'].lower()
-        
-        cast_map = {
-            'datetime': 'datetime',
-            'timestamp': 'datetime',
-            'date': 'date',
-            'json': 'array',
-            'boolean': 'boolean',
-            'tinyint(1)': 'boolean',
-            'int': 'integer',
-            'tinyint': 'integer',
-            'smallint': 'integer',
-            'mediumint': 'integer',
-            'bigint': 'integer',
-            'decimal': 'decimal:2',
-            'float': 'float',
-            'double': 'double',
-        }
-        
-        return cast_map.get(col_type)
+        col_type = column.get('_type_lower') or column['type']
+        entry = TypeMapper.TYPE_TABLE.get(col_type)
+        if entry is None:
+            entry = TypeMapper.TYPE_TABLE.get(col_type.lower(), TypeMapper.DEFAULT_TYPES)
+        return entry[2]
 
 
 class FileHelper:
@@ -352,12 +435,11 @@ class FileHelper:
     @staticmethod
     def ensure_directory(path: str) -> bool:
         """Asegura que un directorio existe, creándolo si es necesario"""
-        import os
         try:
             os.makedirs(path, exist_ok=True)
             return True
         except Exception as e:
-            print(f"Error creando directorio {path}: {e}")
+            _log.error("Error creando directorio %s: %s", path, e)
             return False
     
     @staticmethod
@@ -368,9 +450,26 @@ class FileHelper:
                 f.write(content)
             return True
         except Exception as e:
-            print(f"Error escribiendo archivo {filepath}: {e}")
+            _log.error("Error escribiendo archivo %s: %s", filepath, e)
             return False
     
+    @staticmethod
+    def write_files(files: Iterable[Tuple[str, str]], encoding: str = 'utf-8',
+                    max_workers: int = 8) -> bool:
+        """Escribe varios archivos (ruta, contenido) en paralelo"""
+        files = list(files)
+        
+        # Crear cada directorio padre una sola vez antes de escribir
+        for directory in {os.path.dirname(filepath) for filepath, _ in files}:
+            if directory and not FileHelper.ensure_directory(directory):
+                return False
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda item: FileHelper.write_file(item[0], item[1], encoding), files))
+        
+        return all(results)
+    
     @staticmethod
     def read_file(filepath: str, encoding: str = 'utf-8') -> Optional[str]:
         """Lee contenido de un archivo"""
@@ -378,7 +477,7 @@ class FileHelper:
             with open(filepath, 'r', encoding=encoding) as f:
                 return f.read()
         except Exception as e:
-            print(f"Error leyendo archivo {filepath}: {e}")
+            _log.error("Error leyendo archivo %s: %s", filepath, e)
             return None
 
 
@@ -389,8 +488,8 @@ class TemplateHelper:
     def indent(text: str, spaces: int = 4) -> str:
         """Indenta texto con el número especificado de espacios"""
         indent_str = ' ' * spaces
-        return '\n'.join(indent_str + line if line.strip() else line 
-                        for line in text.split('\n'))
+        return ''.join([indent_str + line if line.strip() else line
+                        for line in text.splitlines(keepends=True)])
     
     @staticmethod
     def format_array(items: List[str], indent: int = 8, quotes: bool = True) -> str:
@@ -401,8 +500,9 @@ class TemplateHelper:
         indent_str = ' ' * indent
         quote = "'" if quotes else ""
         
-        formatted_items = [f"{indent_str}{quote}{item}{quote}" for item in items]
-        return ",\n".join(formatted_items)
+        # Un único join con el separador completo en lugar de un f-string por item
+        separator = f"{quote},\n{indent_str}{quote}"
+        return f"{indent_str}{quote}{separator.join(map(str, items))}{quote}"
     
     @staticmethod
     def format_associative_array(items: Dict[str, str], indent: int = 8) -> str:
@@ -411,56 +511,88 @@ class TemplateHelper:
             return ""
         
         indent_str = ' ' * indent
-        formatted_items = [f"{indent_str}'{key}' => '{value}'" 
-                          for key, value in items.items()]
-        return ",\n".join(formatted_items)
+        separator = f"',\n{indent_str}'"
+        pairs = separator.join([f"{key}' => '{value}" for key, value in items.items()])
+        return f"{indent_str}'{pairs}'"
 
 
 # Funciones de utilidad standalone
 
+# Columnas de timestamp que Laravel gestiona por sí mismo
+TIMESTAMP_COLUMNS = frozenset({'created_at', 'updated_at', 'deleted_at', 'email_verified_at'})
+
+# Sufijo de las columnas FK por convención (tabla_singular_id)
+FK_SUFFIX = sys.intern('_id')
+
+
 def is_foreign_key(column_name: str) -> bool:
     """Detecta si una columna es probablemente una foreign key"""
-    return column_name.endswith('_id') and column_name != 'id'
+    return column_name.endswith(FK_SUFFIX) and column_name != 'id'
 
 
+@lru_cache(maxsize=4096)
 def get_foreign_table_name(column_name: str) -> str:
     """Obtiene el nombre de la tabla desde un nombre de FK"""
-    if column_name.endswith('_id'):
-        singular = column_name[:-3]  # Remover '_id'
+    if column_name.endswith(FK_SUFFIX):
+        singular = column_name[:-len(FK_SUFFIX)]  # Remover '_id'
         return NamingHelper.to_plural(singular)
     return ''
 
 
 def is_timestamp_column(column_name: str) -> bool:
     """Detecta si una columna es un timestamp especial de Laravel"""
-    return column_name in ['created_at', 'updated_at', 'deleted_at', 'email_verified_at']
+    return column_name in TIMESTAMP_COLUMNS
 
 
 def sanitize_php_variable(name: str) -> str:
     """Sanitiza un nombre para usarlo como variable PHP"""
-    # Remover caracteres no válidos
-    name = re.sub(r'[^a-zA-Z0-9_]', '', name)
+    # Remover caracteres no válidos (translate cubre el caso ASCII, el más común)
+    if name.isascii():
+        name = name.translate(_PHP_DELETE_TABLE)
+    else:
+        name = _PHP_SANITIZE_RE.sub('', name)
     # Asegurar que no empiece con número
     if name and name[0].isdigit():
         name = '_' + name
     return name
 
 
+_QUOTE_ESCAPE = str.maketrans({"'": "\\'"})
+
+
+def _php_string(value) -> str:
+    """Literal PHP entre comillas simples, con las comillas escapadas"""
+    return f"'{str(value).translate(_QUOTE_ESCAPE)}'"
+
+
+def _php_quoted(value) -> str:
+    """Literal PHP entre comillas simples, sin escapar"""
+    return f"'{value}'"
+
+
+def _php_array(value) -> str:
+    """Array PHP vacío"""
+    return '[]'
+
+
+# Formateador según el tipo de valor
+_PHP_VALUE_FORMATTERS = {
+    'string': _php_string,
+    'text': _php_string,
+    'integer': str,
+    'int': str,
+    'boolean': str,
+    'bool': str,
+    'array': _php_array,
+}
+
+
 def format_php_value(value: any, value_type: str = 'string') -> str:
     """Formatea un valor para usarlo en código PHP"""
     if value is None:
         return 'null'
     
-    if value_type in ['string', 'text']:
-        # Escapar comillas simples
-        value = str(value).replace("'", "\\'")
-        return f"'{value}'"
-    elif value_type in ['integer', 'int', 'boolean', 'bool']:
-        return str(value)
-    elif value_type == 'array':
-        return '[]'
-    else:
-        return f"'{value}'"
+    return _PHP_VALUE_FORMATTERS.get(value_type, _php_quoted)(value)
 
 
 # Exportar clases y funciones principales
@@ -476,4 +608,6 @@ __all__ = [
     'is_timestamp_column',
     'sanitize_php_variable',
     'format_php_value',
+    'TIMESTAMP_COLUMNS',
+    'FK_SUFFIX',
 ]
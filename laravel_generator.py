@@ -11,6 +11,459 @@ import sys
 from typing import Dict, List, Tuple
 import re
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
+
+# Flags para escribir los archivos generados (O_BINARY solo existe en Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# A partir de este número de tablas la generación se reparte entre procesos;
+# con menos, levantar el pool cuesta más de lo que se gana
+PARALLEL_MIN_TABLES = 32
+
+# Columnas que Laravel gestiona por sí mismo (clave primaria y timestamps)
+AUTO_COLUMNS = frozenset({'id', 'created_at', 'updated_at', 'deleted_at'})
+
+# Valor de una FK en los seeders cuando la tabla destino no tiene IDs, por not_null
+_FK_SEED_FALLBACK = MappingProxyType({False: 'null', True: '1'})
+
+# Escapes para literales PHP entre comillas simples (una sola pasada con translate)
+_PHP_QUOTE_ESCAPE = str.maketrans({'\\': '\\\\', "'": "\\'"})
+
+# Tipo base MySQL -> método de columna en migraciones Laravel (solo lectura)
+MIGRATION_TYPE_MAP = MappingProxyType({
+    'int': 'integer',
+    'integer': 'integer',
+    'tinyint': 'tinyInteger',
+    'smallint': 'smallInteger',
+    'mediumint': 'mediumInteger',
+    'bigint': 'bigInteger',
+    'varchar': 'string',
+    'char': 'char',
+    'text': 'text',
+    'mediumtext': 'mediumText',
+    'longtext': 'longText',
+    'decimal': 'decimal',
+    'float': 'float',
+    'double': 'double',
+    'boolean': 'boolean',
+    'bool': 'boolean',
+    'date': 'date',
+    'datetime': 'dateTime',
+    'timestamp': 'timestamp',
+    'time': 'time',
+    'year': 'year',
+    'json': 'json',
+    'enum': 'enum',
+    'blob': 'binary',
+    'binary': 'binary',
+})
+
+# Tipo MySQL -> cast de Eloquent en los modelos (solo lectura)
+MODEL_CAST_MAP = MappingProxyType({
+    'datetime': 'datetime',
+    'timestamp': 'datetime',
+    'date': 'date',
+    'json': 'array',
+    'boolean': 'boolean',
+    'int': 'integer',
+    'tinyint': 'integer',
+    'smallint': 'integer',
+    'mediumint': 'integer',
+    'bigint': 'integer',
+    'decimal': 'float',
+    'float': 'float',
+    'double': 'float',
+})
+
+# Tipo MySQL -> regla de validación del controlador (solo lectura)
+VALIDATION_TYPE_RULES = MappingProxyType({
+    'int': 'integer',
+    'tinyint': 'integer',
+    'smallint': 'integer',
+    'mediumint': 'integer',
+    'bigint': 'integer',
+    'decimal': 'numeric',
+    'float': 'numeric',
+    'double': 'numeric',
+    'varchar': 'string',
+    'char': 'string',
+    'text': 'string',
+    'mediumtext': 'string',
+    'longtext': 'string',
+    'date': 'date',
+    'datetime': 'date',
+    'timestamp': 'date',
+    'boolean': 'boolean',
+    'json': 'array',
+})
+
+# Heurísticas por nombre para corregir columnas VARCHAR mal tipadas en Workbench.
+# Una sola expresión anclada al inicio: cada alternativa es una búsqueda hacia
+# adelante, así que gana la primera que encaja (mismo orden de prioridad que
+# una cadena de if/elif) y el grupo vacío que la cierra da el tipo corregido
+_VARCHAR_HINT_RE = re.compile(
+    r'(?=(?:.*_)?id\Z)(?P<BIGINT>)'
+    r'|(?=.*(?:fecha|date))(?=.*(?:hora|time|creacion|reservacion))(?P<DATETIME>)'
+    r'|(?=.*(?:fecha|date))(?P<DATE>)'
+    r'|(?=.*(?:hora|time))(?P<TIME>)'
+    r'|(?=(?:edad|age|years)\Z)(?P<INT>)'
+    r'|(?=.*(?:precio|costo|price|cost))(?P<DECIMAL>)',
+    re.DOTALL,
+)
+
+# Reglas de Faker por nombre de columna (en minúsculas), en orden de prioridad.
+# Cada regla: (nombres exactos, fragmentos contenidos, fragmentos que la anulan, valor).
+# El valor es la expresión Faker o una tupla de sub-reglas que afinan la elección
+_FAKER_DATE_RULES = (
+    (frozenset(), ('nacimiento', 'birth'), (), "$faker->date('Y-m-d', '-18 years')"),
+    (frozenset(), ('inicio', 'start', 'alta'), (),
+     "$faker->dateTimeBetween('-1 year', 'now')->format('Y-m-d')"),
+    (frozenset(), ('fin', 'end', 'vencimiento', 'expir'), (),
+     "$faker->dateTimeBetween('now', '+2 years')->format('Y-m-d')"),
+    # '' está contenido en cualquier nombre: fecha genérica por defecto
+    (frozenset(), ('',), (), "$faker->date('Y-m-d')"),
+)
+
+_FAKER_NAME_RULES = (
+    # Nombres / personas
+    (frozenset({'nombre', 'name', 'nombre_completo', 'full_name', 'nombres'}), (), (),
+     "$faker->firstName()"),
+    (frozenset({'last_name', 'surname'}), ('apellido',), (), "$faker->lastName()"),
+    (frozenset({'nombre_usuario', 'username', 'user_name', 'nick', 'alias'}), (), (),
+     "$faker->unique()->userName()"),
+    # Contacto
+    (frozenset(), ('email', 'correo'), (), "$faker->unique()->safeEmail()"),
+    (frozenset({'tel', 'fono'}), ('telefono', 'phone', 'celular', 'movil'), (),
+     "$faker->phoneNumber()"),
+    # Ubicación
+    (frozenset(), ('direccion', 'address', 'domicilio'), (), "$faker->streetAddress()"),
+    (frozenset(), ('ciudad', 'city'), (), "$faker->city()"),
+    (frozenset({'estado', 'state', 'provincia', 'region'}), (), (), "$faker->state()"),
+    (frozenset(), ('pais', 'country'), (), "$faker->country()"),
+    (frozenset({'cp', 'zip', 'codigo_postal'}), ('postal',), (), "$faker->postcode()"),
+    (frozenset(), ('colonia', 'barrio', 'neighborhood'), (),
+     "$faker->citySuffix() . ' ' . $faker->city()"),
+    (frozenset(), ('municipio', 'delegacion'), (), "$faker->city()"),
+    # Credenciales
+    (frozenset(), ('password', 'contrasena', 'contrasenia'), (), "bcrypt($faker->password(8, 16))"),
+    (frozenset(), ('token', 'api_key'), (), "$faker->sha256()"),
+    # Dinero
+    (frozenset(), ('precio', 'price', 'costo', 'cost', 'monto', 'amount', 'tarifa', 'salario',
+                   'sueldo', 'pago', 'total', 'subtotal', 'descuento', 'impuesto'), (),
+     "$faker->randomFloat(2, 10, 9999)"),
+    # Fechas
+    (frozenset(), ('fecha',), (), _FAKER_DATE_RULES),
+    (frozenset(), ('date',), ('update',), _FAKER_DATE_RULES),
+    # Horas
+    (frozenset(), ('hora',), (), "$faker->time('H:i:s')"),
+    (frozenset(), ('time',), ('datetime', 'timestamp'), "$faker->time('H:i:s')"),
+    # Números / medidas
+    (frozenset({'age', 'years', 'anios'}), ('edad',), (), "$faker->numberBetween(1, 99)"),
+    (frozenset(), ('duracion', 'duration', 'minutos', 'minutes'), (),
+     "$faker->numberBetween(15, 120)"),
+    (frozenset(), ('cantidad', 'quantity', 'stock', 'capacidad'), (),
+     "$faker->numberBetween(1, 500)"),
+    (frozenset({'num'}), ('numero', 'number', 'folio'), (), "$faker->numerify('####')"),
+    (frozenset(), ('calificacion', 'rating', 'puntuacion', 'score'), (),
+     "$faker->numberBetween(1, 10)"),
+    (frozenset(), ('porcentaje', 'percent'), (), "$faker->numberBetween(0, 100)"),
+    # Textos descriptivos
+    (frozenset(), ('descripcion', 'description', 'detalle', 'nota', 'observacion', 'comentario',
+                   'resumen', 'biografia', 'bio'), (), "$faker->sentence(12)"),
+    (frozenset(), ('titulo', 'title', 'nombre'), (), "$faker->sentence(3)"),
+    (frozenset(), ('especialidad', 'specialty', 'profesion', 'profession', 'ocupacion', 'cargo',
+                   'puesto', 'job', 'position'), (), "$faker->jobTitle()"),
+    (frozenset(), ('empresa', 'company', 'negocio', 'organizacion'), (), "$faker->company()"),
+    (frozenset(), ('categoria', 'category', 'tipo', 'type', 'clase'), (),
+     "$faker->randomElement(['Tipo A', 'Tipo B', 'Tipo C', 'Especial'])"),
+    (frozenset(), ('estado', 'status', 'estatus'), (),
+     "$faker->randomElement(['activo', 'inactivo', 'pendiente'])"),
+    (frozenset(), ('genero', 'gender', 'sexo'), (),
+     "$faker->randomElement(['masculino', 'femenino', 'otro'])"),
+    (frozenset(), ('color',), (), "$faker->colorName()"),
+    # Media / archivos
+    (frozenset(), ('url', 'link', 'web', 'sitio'), (), "$faker->url()"),
+    (frozenset(), ('imagen', 'foto', 'image', 'photo', 'avatar'), (), "$faker->imageUrl(640, 480)"),
+    (frozenset(), ('archivo', 'file', 'documento'), (), "$faker->lexify('doc_??????.pdf')"),
+    # Identificadores únicos
+    (frozenset({'uuid', 'guid'}), (), (), "$faker->uuid()"),
+    (frozenset({'ip', 'ip_address'}), (), (), "$faker->ipv4()"),
+    (frozenset(), ('activo', 'active', 'habilitado', 'enabled', 'visible'), (), "$faker->boolean()"),
+)
+
+# Tipo base MySQL -> valor Faker cuando el nombre no dice nada (solo lectura);
+# varchar/char se resuelven aparte según su longitud
+FAKER_TYPE_VALUES = MappingProxyType({
+    'int': "$faker->numberBetween(1, 100)",
+    'integer': "$faker->numberBetween(1, 100)",
+    'smallint': "$faker->numberBetween(1, 100)",
+    'mediumint': "$faker->numberBetween(1, 100)",
+    'bigint': "$faker->numberBetween(1, 1000)",
+    'decimal': "$faker->randomFloat(2, 1, 1000)",
+    'float': "$faker->randomFloat(2, 1, 1000)",
+    'double': "$faker->randomFloat(2, 1, 1000)",
+    'text': "$faker->paragraph()",
+    'mediumtext': "$faker->paragraphs(3, true)",
+    'longtext': "$faker->paragraphs(3, true)",
+    'boolean': "$faker->boolean()",
+    'date': "$faker->date('Y-m-d')",
+    'datetime': "$faker->dateTime()->format('Y-m-d H:i:s')",
+    'timestamp': "$faker->dateTime()->format('Y-m-d H:i:s')",
+    'time': "$faker->time('H:i:s')",
+    'json': "json_encode(['valor' => $faker->word(), 'descripcion' => $faker->sentence()])",
+})
+
+
+def _match_faker_rule(rules, name_lower: str):
+    """Devuelve el valor de la primera regla de Faker que encaja con el nombre, o None"""
+    for exact, contains, without, value in rules:
+        if name_lower in exact or (any(frag in name_lower for frag in contains)
+                                   and not any(frag in name_lower for frag in without)):
+            return value if isinstance(value, str) else _match_faker_rule(value, name_lower)
+    return None
+
+# Singulares irregulares (incluye español) usados por LaravelGenerator._singular
+SINGULAR_IRREGULARS_ES = MappingProxyType({
+    'clientes': 'cliente',
+    'medicos': 'medico',
+    'servicios': 'servicio',
+    'horarios': 'horario',
+    'estatus': 'estatus',
+    'roles': 'rol',
+    'users': 'user',
+})
+
+
+# Plantilla de migración, se completa con str.format_map
+MIGRATION_TEMPLATE = """<?php
+
+use Illuminate\\Database\\Migrations\\Migration;
+use Illuminate\\Database\\Schema\\Blueprint;
+use Illuminate\\Support\\Facades\\Schema;
+
+return new class extends Migration
+{{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {{
+        Schema::create('{table_name}', function (Blueprint $table) {{
+{columns_str}{fk_str}{special_str}
+        }});
+    }}
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {{
+        Schema::dropIfExists('{table_name}');
+    }}
+}};
+"""
+
+# Plantilla de modelo Eloquent, se completa con str.format_map
+MODEL_TEMPLATE = """<?php
+
+namespace App\\Models;
+
+{use_str}
+
+class {model_name} extends Model
+{{
+    {traits_str}
+
+    protected $table = '{table_name}';
+
+    protected $fillable = [
+        {fillable_str}
+    ];
+
+    protected $casts = [
+        {casts_str}
+    ];
+{relationships_code}
+}}
+"""
+
+# Plantilla de controlador API, se completa con str.format_map
+CONTROLLER_TEMPLATE = """<?php
+
+namespace App\\Http\\Controllers\\Api;
+
+use App\\Http\\Controllers\\Controller;
+use App\\Models\\{model_name};
+use Illuminate\\Http\\Request;
+use Illuminate\\Http\\JsonResponse;
+
+class {controller_name} extends Controller
+{{
+    /**
+     * Display a listing of the resource.
+     */
+    public function index(): JsonResponse
+    {{
+        ${var_name}s = {model_name}::query(){with_relations}->get();
+
+        return response()->json([
+            'success' => true,
+            'data' => ${var_name}s
+        ]);
+    }}
+
+    /**
+     * Store a newly created resource in storage.
+     */
+    public function store(Request $request): JsonResponse
+    {{
+        $validated = $request->validate([
+{validation_rules}
+        ]);
+
+        ${var_name} = {model_name}::create($validated);
+
+        // Cargar relaciones
+        {load_relations}
+
+        return response()->json([
+            'success' => true,
+            'message' => '{model_name} created successfully',
+            'data' => ${var_name}
+        ], 201);
+    }}
+
+    /**
+     * Display the specified resource.
+     */
+    public function show({model_name} ${var_name}): JsonResponse
+    {{
+        // Cargar relaciones
+        {load_relations}
+
+        return response()->json([
+            'success' => true,
+            'data' => ${var_name}
+        ]);
+    }}
+
+    /**
+     * Update the specified resource in storage.
+     */
+    public function update(Request $request, {model_name} ${var_name}): JsonResponse
+    {{
+        $validated = $request->validate([
+{validation_rules}
+        ]);
+
+        ${var_name}->update($validated);
+
+        // Recargar relaciones
+        {load_relations}
+
+        return response()->json([
+            'success' => true,
+            'message' => '{model_name} updated successfully',
+            'data' => ${var_name}
+        ]);
+    }}
+
+    /**
+     * Remove the specified resource from storage.
+     */
+    public function destroy({model_name} ${var_name}): JsonResponse
+    {{
+        ${var_name}->delete();
+
+        return response()->json([
+            'success' => true,
+            'message' => '{model_name} deleted successfully'
+        ]);
+    }}
+}}
+"""
+
+# Plantilla de seeder con Faker, se completa con str.format_map
+SEEDER_TEMPLATE = """<?php
+
+namespace Database\\Seeders;
+
+{fk_imports}use Illuminate\\Database\\Seeder;
+use Illuminate\\Support\\Facades\\DB;
+
+class {seeder_name} extends Seeder
+{{
+    /**
+     * Run the database seeds.
+     * Genera 10 registros de prueba para la tabla {table_name}.
+     */
+    public function run(): void
+    {{
+        // Instancia compartida por locale (helper fake() de Laravel)
+        $faker = fake('es_MX');
+
+        // Precargar IDs de tablas relacionadas
+        {fk_setup}
+
+        $now = now();
+        $rows = [];
+        for ($i = 0; $i < 10; $i++) {{
+            $rows[] = [
+{faker_fields}
+                'created_at' => $now,
+                'updated_at' => $now,
+            ];
+        }}
+
+        // Un solo INSERT para los 10 registros (sin eventos de Eloquent)
+        DB::table('{table_name}')->insert($rows);
+    }}
+}}
+"""
+
+# Plantilla del DatabaseSeeder, se completa con str.format_map
+DATABASE_SEEDER_TEMPLATE = """<?php
+
+namespace Database\\Seeders;
+
+// use Illuminate\\Database\\Console\\Seeds\\WithoutModelEvents;
+use Illuminate\\Database\\Seeder;
+
+class DatabaseSeeder extends Seeder
+{{
+    /**
+     * Seed the application's database.
+     * Orden: tablas base → tablas con dependencias (respeta FK order).
+     */
+    public function run(): void
+    {{
+{calls}
+    }}
+}}
+"""
+
+# Línea de ruta por tabla, se completa con los nombres de LaravelGenerator._table_names
+ROUTE_LINE_TEMPLATE = "Route::apiResource('{route_name}', \\App\\Http\\Controllers\\Api\\{controller_name}::class);"
+
+# Plantilla del archivo de rutas API, se completa con str.format_map
+ROUTES_TEMPLATE = """<?php
+
+    use Illuminate\\Http\\Request;
+    use Illuminate\\Support\\Facades\\Route;
+
+
+    /*
+    |--------------------------------------------------------------------------
+    | API Routes
+    |--------------------------------------------------------------------------
+    */
+
+    // Rutas API generadas automáticamente
+    {routes}
+    """
 
 
 class WorkbenchParser:
@@ -21,6 +474,9 @@ class WorkbenchParser:
         self.tables = []
         self.relationships = []
         self.debug = debug
+        # id de Workbench -> nombre, llenados al leer cada tabla
+        self._table_map = {}
+        self._column_map = {}
 
     def parse(self):
         """Extrae y parsea el XML del archivo .mwb"""
@@ -28,47 +484,70 @@ class WorkbenchParser:
             with zipfile.ZipFile(self.mwb_file, 'r') as zip_ref:
                 # El archivo document.mwb.xml contiene el modelo
                 with zip_ref.open('document.mwb.xml') as xml_file:
-                    tree = ET.parse(xml_file)
-                    root = tree.getroot()
-                    self._extract_tables(root)
-                    self._extract_relationships(root)
+                    self._stream_document(xml_file)
             return True
         except Exception as e:
             print(f"Error al parsear el archivo .mwb: {e}")
             return False
 
-    def _extract_tables(self, root):
-        """Extrae información de las tablas"""
-        for table in root.findall(".//value[@struct-name='db.mysql.Table']"):
-            table_info = {
-                'name': self._get_text(table, "value[@key='name']"),
-                'comment': self._get_text(table, "value[@key='comment']"),
-                'columns': [],
-                'indexes': [],
-                'has_soft_deletes': False
-            }
+    def _stream_document(self, xml_file):
+        """Recorre el XML en streaming, liberando cada tabla al terminar de leerla"""
+        for _, elem in ET.iterparse(xml_file):
+            if elem.tag != 'value':
+                continue
+
+            struct_name = elem.get('struct-name')
+            if struct_name == 'db.mysql.ForeignKey':
+                # Las FKs cierran antes que su tabla y pueden apuntar a tablas
+                # que aún no se leyeron: los ids se resuelven al final
+                self.relationships.append(self._extract_foreign_key(elem))
+            elif struct_name == 'db.mysql.Table':
+                self._extract_table(elem)
+                elem.clear()
+
+        self._resolve_relationships()
+
+    def _extract_table(self, table):
+        """Extrae información de una tabla y registra sus ids"""
+        fields = self._children_by_key(table)
+        table_info = {
+            'name': sys.intern(self._child_text(fields, 'name')),
+            'comment': self._child_text(fields, 'comment'),
+            'columns': [],
+            'indexes': [],
+            'has_soft_deletes': False
+        }
+
+        table_id = table.get('id')
+        if table_id and table_info['name']:
+            self._table_map[table_id] = table_info['name']
 
-            columns = table.find("value[@key='columns']")
-            if columns is not None:
-                for col in columns.findall("value"):
-                    column_info = self._extract_column(col)
-                    table_info['columns'].append(column_info)
+        columns = fields.get(('value', 'columns'))
+        if columns is not None:
+            for col in columns.findall("value"):
+                column_info = self._extract_column(col)
+                table_info['columns'].append(column_info)
 
-                    if column_info['name'] == 'deleted_at':
-                        table_info['has_soft_deletes'] = True
+                col_id = col.get('id')
+                if col_id and column_info['name']:
+                    self._column_map[col_id] = column_info['name']
 
-            indices = table.find("value[@key='indices']")
-            if indices is not None:
-                for idx in indices.findall("value"):
-                    index_info = self._extract_index(idx)
-                    table_info['indexes'].append(index_info)
+                if column_info['name'] == 'deleted_at':
+                    table_info['has_soft_deletes'] = True
 
-            self.tables.append(table_info)
+        indices = fields.get(('value', 'indices'))
+        if indices is not None:
+            for idx in indices.findall("value"):
+                index_info = self._extract_index(idx)
+                table_info['indexes'].append(index_info)
+
+        self.tables.append(table_info)
 
     def _extract_column(self, column_elem):
         """Extrae información de una columna"""
-        simple_type = self._get_text(column_elem, "value[@key='simpleType']")
-        user_type = self._get_text(column_elem, "link[@key='userType']")
+        fields = self._children_by_key(column_elem)
+        simple_type = self._child_text(fields, 'simpleType')
+        user_type = self._child_text(fields, 'userType', tag='link')
 
         col_type = simple_type if simple_type else user_type
         if not col_type:
@@ -76,8 +555,9 @@ class WorkbenchParser:
 
         col_type = col_type.split('.')[-1] if '.' in col_type else col_type
 
-        col_name = self._get_text(column_elem, "value[@key='name']")
-        is_auto_inc = self._get_text(column_elem, "value[@key='autoIncrement']") == '1'
+        # Nombres internados: se comparan y usan como clave en todos los índices
+        col_name = sys.intern(self._child_text(fields, 'name'))
+        is_auto_inc = self._child_text(fields, 'autoIncrement') == '1'
 
         if is_auto_inc and col_type.lower() == 'varchar':
             col_type = 'BIGINT'
@@ -86,46 +566,29 @@ class WorkbenchParser:
 
         col_name_lower = col_name.lower()
         if col_type.lower() == 'varchar':
-            if col_name_lower.endswith('_id') or col_name_lower == 'id':
-                col_type = 'BIGINT'
+            hint = _VARCHAR_HINT_RE.match(col_name_lower)
+            if hint:
+                col_type = hint.lastgroup
                 if self.debug:
-                    print(f"  ⚠️  CORRECCIÓN: {col_name} cambiado de VARCHAR a BIGINT (parece ID)")
-
-            elif 'fecha' in col_name_lower or 'date' in col_name_lower:
-                if 'hora' in col_name_lower or 'time' in col_name_lower or 'creacion' in col_name_lower or 'reservacion' in col_name_lower:
-                    col_type = 'DATETIME'
-                    if self.debug:
-                        print(f"  ⚠️  CORRECCIÓN: {col_name} cambiado de VARCHAR a DATETIME")
-                else:
-                    col_type = 'DATE'
-                    if self.debug:
-                        print(f"  ⚠️  CORRECCIÓN: {col_name} cambiado de VARCHAR a DATE")
-
-            elif 'hora' in col_name_lower or 'time' in col_name_lower:
-                col_type = 'TIME'
-                if self.debug:
-                    print(f"  ⚠️  CORRECCIÓN: {col_name} cambiado de VARCHAR a TIME")
-
-            elif col_name_lower in ['edad', 'age', 'years']:
-                col_type = 'INT'
-                if self.debug:
-                    print(f"  ⚠️  CORRECCIÓN: {col_name} cambiado de VARCHAR a INT")
-
-            elif 'precio' in col_name_lower or 'costo' in col_name_lower or 'price' in col_name_lower or 'cost' in col_name_lower:
-                col_type = 'DECIMAL'
-                if self.debug:
-                    print(f"  ⚠️  CORRECCIÓN: {col_name} cambiado de VARCHAR a DECIMAL")
+                    reason = " (parece ID)" if col_type == 'BIGINT' else ""
+                    print(f"  ⚠️  CORRECCIÓN: {col_name} cambiado de VARCHAR a {col_type}{reason}")
 
         col_info = {
             'name': col_name,
+            # Nombre en minúsculas para las heurísticas de faker y migraciones
+            '_name_lower': sys.intern(col_name_lower),
             'type': col_type,
-            'length': self._get_text(column_elem, "value[@key='length']"),
-            'precision': self._get_text(column_elem, "value[@key='precision']"),
-            'scale': self._get_text(column_elem, "value[@key='scale']"),
-            'not_null': self._get_text(column_elem, "value[@key='isNotNull']") == '1',
+            # Tipo en minúsculas, calculado una vez para los helpers
+            '_type_lower': sys.intern(col_type.lower()),
+            # Tipo base sin longitud: "varchar(45)" -> "varchar"
+            '_base_type': sys.intern(col_type.lower().split('(')[0].strip()),
+            'length': self._child_text(fields, 'length'),
+            'precision': self._child_text(fields, 'precision'),
+            'scale': self._child_text(fields, 'scale'),
+            'not_null': self._child_text(fields, 'isNotNull') == '1',
             'auto_increment': is_auto_inc,
-            'default': self._get_text(column_elem, "value[@key='defaultValue']"),
-            'comment': self._get_text(column_elem, "value[@key='comment']"),
+            'default': self._child_text(fields, 'defaultValue'),
+            'comment': self._child_text(fields, 'comment'),
         }
 
         if self.debug:
@@ -135,87 +598,84 @@ class WorkbenchParser:
 
     def _extract_index(self, index_elem):
         """Extrae información de un índice"""
+        fields = self._children_by_key(index_elem)
         idx_info = {
-            'name': self._get_text(index_elem, "value[@key='name']"),
-            'type': self._get_text(index_elem, "value[@key='indexType']"),
-            'unique': self._get_text(index_elem, "value[@key='unique']") == '1',
+            'name': self._child_text(fields, 'name'),
+            'type': self._child_text(fields, 'indexType'),
+            'unique': self._child_text(fields, 'unique') == '1',
             'columns': []
         }
 
-        columns = index_elem.find("value[@key='columns']")
+        columns = fields.get(('value', 'columns'))
         if columns is not None:
-            for col_ref in columns.findall(".//link"):
+            for col_ref in columns.iter('link'):
                 col_name = col_ref.text.split('/')[-1] if col_ref.text else ''
                 if col_name:
-                    idx_info['columns'].append(col_name)
+                    idx_info['columns'].append(sys.intern(col_name))
 
         return idx_info
 
-    def _extract_relationships(self, root):
-        """Extrae relaciones entre tablas (foreign keys)"""
-        table_map = {}
-        column_map = {}
-
-        for table in root.findall(".//value[@struct-name='db.mysql.Table']"):
-            table_id = table.get('id')
-            table_name = self._get_text(table, "value[@key='name']")
-            if table_id and table_name:
-                table_map[table_id] = table_name
-
-            columns = table.find("value[@key='columns']")
-            if columns is not None:
-                for col in columns.findall("value"):
-                    col_id = col.get('id')
-                    col_name = self._get_text(col, "value[@key='name']")
-                    if col_id and col_name:
-                        column_map[col_id] = col_name
-
-        for fk in root.findall(".//value[@struct-name='db.mysql.ForeignKey']"):
-            rel_info = {
-                'name': self._get_text(fk, "value[@key='name']"),
-                'source_table': None,
-                'target_table': None,
-                'source_columns': [],
-                'target_columns': [],
-                'on_delete': self._get_text(fk, "value[@key='deleteRule']", 'RESTRICT'),
-                'on_update': self._get_text(fk, "value[@key='updateRule']", 'RESTRICT'),
-            }
+    def _extract_foreign_key(self, fk):
+        """Extrae una foreign key con los ids de tablas y columnas sin resolver"""
+        fields = self._children_by_key(fk)
+        rel_info = {
+            'name': self._child_text(fields, 'name'),
+            'source_table': None,
+            'target_table': None,
+            'source_columns': [],
+            'target_columns': [],
+            'on_delete': self._child_text(fields, 'deleteRule', 'RESTRICT'),
+            'on_update': self._child_text(fields, 'updateRule', 'RESTRICT'),
+        }
+
+        owner_link = fields.get(('link', 'owner'))
+        if owner_link is not None and owner_link.text:
+            rel_info['source_table'] = owner_link.text
 
-            owner_link = fk.find("link[@key='owner']")
-            if owner_link is not None and owner_link.text:
-                owner_id = owner_link.text
-                rel_info['source_table'] = table_map.get(owner_id, owner_id)
-
-            ref_table_link = fk.find("link[@key='referencedTable']")
-            if ref_table_link is not None and ref_table_link.text:
-                ref_id = ref_table_link.text
-                rel_info['target_table'] = table_map.get(ref_id, ref_id)
-
-            columns = fk.find("value[@key='columns']")
-            if columns is not None:
-                for col_link in columns.findall(".//link"):
-                    if col_link.text:
-                        col_id = col_link.text
-                        col_name = column_map.get(col_id, col_id)
-                        rel_info['source_columns'].append(col_name)
-
-            ref_columns = fk.find("value[@key='referencedColumns']")
-            if ref_columns is not None:
-                for col_link in ref_columns.findall(".//link"):
-                    if col_link.text:
-                        col_id = col_link.text
-                        col_name = column_map.get(col_id, col_id)
-                        rel_info['target_columns'].append(col_name)
+        ref_table_link = fields.get(('link', 'referencedTable'))
+        if ref_table_link is not None and ref_table_link.text:
+            rel_info['target_table'] = ref_table_link.text
+
+        columns = fields.get(('value', 'columns'))
+        if columns is not None:
+            for col_link in columns.iter('link'):
+                if col_link.text:
+                    rel_info['source_columns'].append(col_link.text)
+
+        ref_columns = fields.get(('value', 'referencedColumns'))
+        if ref_columns is not None:
+            for col_link in ref_columns.iter('link'):
+                if col_link.text:
+                    rel_info['target_columns'].append(col_link.text)
+
+        return rel_info
+
+    def _resolve_relationships(self):
+        """Traduce los ids de las relaciones (foreign keys) a nombres de tablas y columnas"""
+        for rel_info in self.relationships:
+            if rel_info['source_table']:
+                rel_info['source_table'] = self._table_map.get(rel_info['source_table'], rel_info['source_table'])
+            if rel_info['target_table']:
+                rel_info['target_table'] = self._table_map.get(rel_info['target_table'], rel_info['target_table'])
+            rel_info['source_columns'] = [self._column_map.get(col_id, col_id) for col_id in rel_info['source_columns']]
+            rel_info['target_columns'] = [self._column_map.get(col_id, col_id) for col_id in rel_info['target_columns']]
 
             if self.debug:
                 print(
                     f"  DEBUG Relation: {rel_info['source_table']}.{rel_info['source_columns']} → {rel_info['target_table']}.{rel_info['target_columns']}")
 
-            self.relationships.append(rel_info)
-
-    def _get_text(self, element, path, default=''):
-        """Helper para obtener texto de un elemento XML"""
-        found = element.find(path)
+    def _children_by_key(self, element):
+        """Indexa los hijos directos por (tag, key) en una sola pasada"""
+        children = {}
+        for child in element:
+            key = child.get('key')
+            if key is not None:
+                children.setdefault((child.tag, key), child)
+        return children
+
+    def _child_text(self, children, key, default='', tag='value'):
+        """Texto de un hijo indexado por _children_by_key"""
+        found = children.get((tag, key))
         return found.text if found is not None and found.text else default
 
 
@@ -223,13 +683,75 @@ class LaravelGenerator:
     """Generador de código Laravel"""
 
     # Tablas excluidas de generación de seeders
-    SEEDER_EXCLUDED_TABLES = {'users', 'rol', 'estatus', 'roles', 'status'}
+    SEEDER_EXCLUDED_TABLES = frozenset({'users', 'rol', 'estatus', 'roles', 'status'})
 
-    def __init__(self, tables: List[Dict], relationships: List[Dict], output_dir: str):
+    def __init__(self, tables: List[Dict], relationships: List[Dict], output_dir: str,
+                 output_zip: str = None):
         self.tables = tables
         self.relationships = relationships
         self.output_dir = output_dir
+        # Si se indica, todo se escribe dentro de este .zip en lugar de output_dir
+        self.output_zip = output_zip
         self.migration_counter = 1
+        self._timestamp_base = None
+        self._zip = None
+        self._names_cache = {}
+        self._relations_cache = {}
+        self._index_relationships()
+
+    def _index_relationships(self):
+        """Indexa las relaciones por tabla origen, tabla destino y columna FK"""
+        self._fks_by_source = {}
+        self._fks_by_target = {}
+        self._fk_by_column = {}
+        self._fk_column_names = set()
+        # Esquemas sin FKs: los generadores de relaciones se saltan por completo
+        self._has_relationships = bool(self.relationships)
+
+        for rel in self.relationships:
+            self._fks_by_source.setdefault(rel['source_table'], []).append(rel)
+            self._fks_by_target.setdefault(rel['target_table'], []).append(rel)
+            for source_col in rel.get('source_columns', []):
+                # Gana la primera relación, como en el recorrido lineal
+                self._fk_by_column.setdefault((rel['source_table'], source_col), rel)
+                self._fk_column_names.add(source_col)
+
+        # (tabla, columna) que admiten NULL, para los foreignId()->nullable()
+        self._nullable_columns = set()
+        # tabla -> {columna: es FK}: declarada en una relación o con sufijo _id
+        self._fk_flags_by_table = {}
+        for table in self.tables:
+            table_name = table['name']
+            fk_flags = self._fk_flags_by_table.setdefault(table_name, {})
+            for col in table['columns']:
+                name = col['name']
+                if not col['not_null']:
+                    self._nullable_columns.add((table_name, name))
+                fk_flags[name] = (
+                    (table_name, name) in self._fk_by_column
+                    or (name.endswith('_id') and name != 'id')
+                )
+
+    def _table_names(self, table_name: str) -> Dict[str, str]:
+        """Devuelve (y memoriza) los nombres derivados de una tabla"""
+        names = self._names_cache.get(table_name)
+        if names is None:
+            singular = self._singular(table_name)
+            model_name = self._to_studly_case(singular)
+            names = {
+                'name_lower': table_name.lower(),
+                'singular': singular,
+                'model_name': model_name,
+                # Método de relación / variable del modelo: userProfile
+                'method_name': self._to_camel_case(singular),
+                # Variable derivada del nombre del modelo: userprofile
+                'var_name': self._to_camel_case(model_name),
+                'controller_name': f"{model_name}Controller",
+                'seeder_name': f"{model_name}Seeder",
+                'route_name': self._to_kebab_case(table_name),
+            }
+            self._names_cache[table_name] = names
+        return names
 
     def _sort_tables_by_dependencies(self):
         """
@@ -248,54 +770,50 @@ class LaravelGenerator:
         sorted_tables = []
         visited = set()
 
-        def visit(table_name):
-            if table_name in visited:
-                return
-            visited.add(table_name)
-
-            for dep in dependency_map[table_name]:
-                visit(dep)
-
-            sorted_tables.append(table_name)
-
-        for table in dependency_map:
-            visit(table)
+        # DFS en postorden con pila explícita: sin recursión ni riesgo de
+        # RecursionError en cadenas largas de FKs, y con el mismo orden de salida
+        for root in dependency_map:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(dependency_map[root]))]
+
+            while stack:
+                table_name, deps = stack[-1]
+                for dep in deps:
+                    if dep not in visited:
+                        visited.add(dep)
+                        stack.append((dep, iter(dependency_map[dep])))
+                        break
+                else:
+                    stack.pop()
+                    sorted_tables.append(table_name)
 
-        ordered = []
-        for name in sorted_tables:
-            for table in self.tables:
-                if table['name'] == name:
-                    ordered.append(table)
+        # Reordenar con un índice nombre -> tablas en lugar de buscar cada nombre
+        tables_by_name = {}
+        for table in self.tables:
+            tables_by_name.setdefault(table['name'], []).append(table)
 
-        self.tables = ordered
+        self.tables = [table for name in sorted_tables for table in tables_by_name[name]]
 
     def generate_all(self):
         """Genera todos los archivos de Laravel"""
-        self._create_directories()
+        # Una sola lectura del reloj para todas las migraciones de esta corrida
+        self._timestamp_base = datetime.now().strftime('%Y_%m_%d_%H%M%S')
         self._sort_tables_by_dependencies()
 
-        for table in self.tables:
-            print(f"Generando archivos para tabla: {table['name']}")
-
-            self.generate_migration(table)
-
-            if table['name'].lower() != 'users':
-                self.generate_model(table)
-            else:
-                print("  ⚠️  Modelo omitido para tabla 'users'")
-
-            self.generate_controller(table)
-
-            # Generar seeder solo para tablas no excluidas
-            if table['name'].lower() not in self.SEEDER_EXCLUDED_TABLES:
-                self.generate_seeder(table)
-            else:
-                print(f"  ⚠️  Seeder omitido para tabla '{table['name']}'")
-
-        self.generate_routes()
-        self.generate_database_seeder()
+        if self.output_zip:
+            # Un solo archivo de salida: sin directorios ni archivos sueltos. El zip
+            # no se puede compartir entre procesos, así que se genera en serie
+            with zipfile.ZipFile(self.output_zip, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=1) as self._zip:
+                self._generate_files(parallel=False)
+            self._zip = None
+        else:
+            self._create_directories()
+            self._generate_files(parallel=len(self.tables) >= PARALLEL_MIN_TABLES)
 
-        print(f"\n✓ Generación completada en: {self.output_dir}")
+        print(f"\n✓ Generación completada en: {self.output_zip or self.output_dir}")
         print("\nPróximos pasos:")
         print("1. Copia las migraciones a database/migrations/")
         print("2. Copia los modelos a app/Models/")
@@ -305,6 +823,48 @@ class LaravelGenerator:
         print("6. Agrega las rutas de api.php a tu proyecto")
         print("7. Ejecuta: php artisan migrate --seed")
 
+    def _generate_files(self, parallel: bool):
+        """Genera los archivos de todas las tablas, las rutas y el DatabaseSeeder"""
+        # Numerar las migraciones antes de repartir el trabajo: así el orden no
+        # depende de qué proceso termina primero
+        jobs = list(enumerate(self.tables, start=self.migration_counter))
+        self.migration_counter += len(jobs)
+
+        if parallel:
+            with ProcessPoolExecutor(initializer=_init_worker, initargs=(self,)) as executor:
+                results = executor.map(_generate_table_in_worker, jobs,
+                                       chunksize=max(1, len(jobs) // (4 * (os.cpu_count() or 1))))
+                for log_lines in results:
+                    print("\n".join(log_lines))
+        else:
+            for number, table in jobs:
+                print("\n".join(self._generate_table_files(table, number)))
+
+        self.generate_routes()
+        self.generate_database_seeder()
+
+    def _generate_table_files(self, table: Dict, number: int) -> List[str]:
+        """Genera migración, modelo, controlador y seeder de una tabla; devuelve el log"""
+        log_lines = [f"Generando archivos para tabla: {table['name']}"]
+        name_lower = self._table_names(table['name'])['name_lower']
+
+        self.generate_migration(table, number)
+
+        if name_lower != 'users':
+            self.generate_model(table)
+        else:
+            log_lines.append("  ⚠️  Modelo omitido para tabla 'users'")
+
+        self.generate_controller(table)
+
+        # Generar seeder solo para tablas no excluidas
+        if name_lower not in self.SEEDER_EXCLUDED_TABLES:
+            log_lines.append(f"  ✓ Seeder generado: {self.generate_seeder(table)}")
+        else:
+            log_lines.append(f"  ⚠️  Seeder omitido para tabla '{table['name']}'")
+
+        return log_lines
+
     def _create_directories(self):
         """Crea estructura limpia de directorios (borra contenido previo)"""
         dirs = [
@@ -316,44 +876,54 @@ class LaravelGenerator:
         ]
 
         for dir_path in dirs:
-            if os.path.exists(dir_path):
-                shutil.rmtree(dir_path)
-            os.makedirs(dir_path)
+            if not os.path.isdir(dir_path):
+                os.makedirs(dir_path)
+                continue
+
+            # El generador solo deja archivos planos: vaciar sin recorrer con rmtree
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
 
-    def generate_migration(self, table: Dict):
-        """Genera archivo de migración"""
+    def generate_migration(self, table: Dict, number: int = None):
+        """Genera archivo de migración (number se asigna de antemano al generar en paralelo)"""
         table_name = table['name']
         class_name = self._to_studly_case(f"create_{table_name}_table")
 
-        timestamp = datetime.now().strftime('%Y_%m_%d_%H%M%S')
-        timestamp = f"{timestamp}_{self.migration_counter:02d}"
-        migration_number = str(self.migration_counter).zfill(2)
+        if number is None:
+            number = self.migration_counter
+            self.migration_counter += 1
+
+        if self._timestamp_base is None:
+            self._timestamp_base = datetime.now().strftime('%Y_%m_%d_%H%M%S')
+        timestamp = f"{self._timestamp_base}_{number:02d}"
+        migration_number = str(number).zfill(2)
         filename = f"{timestamp}_{migration_number}_create_{table_name}_table.php"
 
         content = self._generate_migration_content(table, class_name)
 
         filepath = f"{self.output_dir}/migrations/{filename}"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        self.migration_counter += 1
+        self._write_file(filepath, content)
 
     def _generate_migration_content(self, table: Dict, class_name: str) -> str:
         """Genera el contenido de la migración"""
         table_name = table['name']
+        # Líneas sin sangría; se unen con el separador ya sangrado
         columns_code = []
 
         for col in table['columns']:
             col_line = self._column_to_migration(col, table_name)
             if col_line:
-                columns_code.append(f"            {col_line}")
+                columns_code.append(col_line)
 
         fk_code = []
-        for rel in self.relationships:
-            if rel['source_table'] == table_name:
-                fk_line = self._relationship_to_migration(rel)
-                if fk_line:
-                    fk_code.append(f"            {fk_line}")
+        for rel in self._fks_by_source.get(table_name, ()):
+            fk_line = self._relationship_to_migration(rel)
+            if fk_line:
+                fk_code.append(fk_line)
 
         has_soft_deletes = table['has_soft_deletes']
 
@@ -363,140 +933,88 @@ class LaravelGenerator:
         if has_soft_deletes:
             special_columns.append("            $table->softDeletes();")
 
-        columns_str = "\n".join(columns_code)
-        fk_str = "\n" + "\n".join(fk_code) if fk_code else ""
-        special_str = "\n\n" + "\n".join(special_columns) if special_columns else ""
-
-        return f"""<?php
-
-use Illuminate\\Database\\Migrations\\Migration;
-use Illuminate\\Database\\Schema\\Blueprint;
-use Illuminate\\Support\\Facades\\Schema;
-
-return new class extends Migration
-{{
-    /**
-     * Run the migrations.
-     */
-    public function up(): void
-    {{
-        Schema::create('{table_name}', function (Blueprint $table) {{
-{columns_str}{fk_str}{special_str}
-        }});
-    }}
+        columns_str = "            " + "\n            ".join(columns_code) if columns_code else ""
+        fk_str = "\n            " + "\n            ".join(fk_code) if fk_code else ""
+        special_str = "\n\n" + "\n".join(special_columns) if special_columns else ""
 
-    /**
-     * Reverse the migrations.
-     */
-    public function down(): void
-    {{
-        Schema::dropIfExists('{table_name}');
-    }}
-}};
-"""
+        return MIGRATION_TEMPLATE.format_map({
+            'table_name': table_name,
+            'columns_str': columns_str,
+            'fk_str': fk_str,
+            'special_str': special_str,
+        })
 
     def _column_to_migration(self, col: Dict, table_name: str = None) -> str:
         """Convierte una columna a código de migración Laravel"""
         name = col['name']
-        col_type = col['type'].lower().strip()
-
         is_fk = self._is_foreign_key_column(name, table_name)
         if is_fk:
             return None
 
-        base_type = col_type.split('(')[0].strip()
-
-        type_map = {
-            'int': 'integer',
-            'integer': 'integer',
-            'tinyint': 'tinyInteger',
-            'smallint': 'smallInteger',
-            'mediumint': 'mediumInteger',
-            'bigint': 'bigInteger',
-            'varchar': 'string',
-            'char': 'char',
-            'text': 'text',
-            'mediumtext': 'mediumText',
-            'longtext': 'longText',
-            'decimal': 'decimal',
-            'float': 'float',
-            'double': 'double',
-            'boolean': 'boolean',
-            'bool': 'boolean',
-            'date': 'date',
-            'datetime': 'dateTime',
-            'timestamp': 'timestamp',
-            'time': 'time',
-            'year': 'year',
-            'json': 'json',
-            'enum': 'enum',
-            'blob': 'binary',
-            'binary': 'binary',
-        }
+        base_type = col['_base_type']
 
-        laravel_type = type_map.get(base_type, 'string')
+        laravel_type = MIGRATION_TYPE_MAP.get(base_type, 'string')
 
         if name == 'id':
-            if base_type in ['bigint', 'int', 'integer']:
+            if base_type in ('bigint', 'int', 'integer'):
                 return "$table->id();"
             else:
                 return "$table->string('id');"
 
-        if name in ['created_at', 'updated_at']:
-            return None
-
-        if name == 'deleted_at':
+        if name in ('created_at', 'updated_at', 'deleted_at'):
             return None
 
-        if laravel_type in ['string', 'char']:
+        if laravel_type in ('string', 'char'):
             length = col['length']
             if not length or length == '' or length == '-1' or not str(length).replace('-', '').isdigit():
                 length = '255'
             elif int(length) < 0:
                 length = '255'
-            line = f"$table->{laravel_type}('{name}', {length})"
+            parts = [f"$table->{laravel_type}('{name}', {length})"]
         elif laravel_type == 'decimal':
             precision = col['precision'] if col['precision'] and str(col['precision']).isdigit() else '8'
             scale = col['scale'] if col['scale'] and str(col['scale']).isdigit() else '2'
-            line = f"$table->decimal('{name}', {precision}, {scale})"
-        elif laravel_type in ['integer', 'bigInteger', 'tinyInteger', 'smallInteger', 'mediumInteger']:
-            line = f"$table->{laravel_type}('{name}')"
+            parts = [f"$table->decimal('{name}', {precision}, {scale})"]
+        elif laravel_type in ('integer', 'bigInteger', 'tinyInteger', 'smallInteger', 'mediumInteger'):
+            parts = [f"$table->{laravel_type}('{name}')"]
             if col['auto_increment']:
-                line += "->autoIncrement()"
+                parts.append("->autoIncrement()")
         else:
-            line = f"$table->{laravel_type}('{name}')"
+            parts = [f"$table->{laravel_type}('{name}')"]
 
         if not col['not_null'] and name != 'id':
-            line += "->nullable()"
+            parts.append("->nullable()")
 
-        if col['default'] and col['default'] not in ['NULL', 'null', '']:
+        if col['default'] and col['default'] not in ('NULL', 'null', ''):
             default_val = col['default']
-            if laravel_type in ['string', 'char', 'text', 'mediumText', 'longText']:
-                line += f"->default('{default_val}')"
+            if laravel_type in ('string', 'char', 'text', 'mediumText', 'longText'):
+                parts.append(f"->default('{default_val}')")
             else:
-                line += f"->default({default_val})"
+                parts.append(f"->default({default_val})")
 
-        if 'email' in name.lower() and laravel_type == 'string':
-            line += "->unique()"
+        if laravel_type == 'string' and 'email' in col['_name_lower']:
+            parts.append("->unique()")
 
         if col['comment']:
-            comment = col['comment'].replace("'", "\\'")
-            line += f"->comment('{comment}')"
+            comment = col['comment'].translate(_PHP_QUOTE_ESCAPE)
+            parts.append(f"->comment('{comment}')")
 
-        line += ";"
-        return line
+        parts.append(";")
+        return "".join(parts)
 
     def _is_foreign_key_column(self, column_name: str, table_name: str = None) -> bool:
         """Verifica si una columna es foreign key"""
-        for rel in self.relationships:
-            if column_name in rel.get('source_columns', []):
-                if table_name is None or rel.get('source_table') == table_name:
-                    return True
+        # Columnas de una tabla conocida: ya clasificadas en _index_relationships
+        is_fk = self._fk_flags_by_table.get(table_name, {}).get(column_name)
+        if is_fk is not None:
+            return is_fk
 
-        if column_name.endswith('_id') and column_name != 'id':
-            return True
+        if table_name is None:
+            is_declared = column_name in self._fk_column_names
+        else:
+            is_declared = (table_name, column_name) in self._fk_by_column
 
-        return False
+        return is_declared or (column_name.endswith('_id') and column_name != 'id')
 
     def _relationship_to_migration(self, rel: Dict) -> str:
         """Convierte una relación a foreign key en migración usando foreignId()->constrained()"""
@@ -506,76 +1024,57 @@ return new class extends Migration
         source_col = rel['source_columns'][0]
         target_table = rel['target_table']
 
-        is_nullable = False
-        for table in self.tables:
-            if table['name'] == rel['source_table']:
-                for col in table['columns']:
-                    if col['name'] == source_col and not col['not_null']:
-                        is_nullable = True
-                        break
+        is_nullable = (rel['source_table'], source_col) in self._nullable_columns
 
-        nullable_str = "->nullable()" if is_nullable else ""
-        line = f"$table->foreignId('{source_col}'){nullable_str}"
-        line += f"->constrained('{target_table}')"
+        parts = [f"$table->foreignId('{source_col}')"]
+        if is_nullable:
+            parts.append("->nullable()")
+        parts.append(f"->constrained('{target_table}')")
 
         on_delete = rel['on_delete'].lower()
         on_update = rel['on_update'].lower()
 
         if on_delete == 'cascade':
-            line += "->cascadeOnDelete()"
+            parts.append("->cascadeOnDelete()")
         elif on_delete == 'set null':
-            line += "->nullOnDelete()"
+            parts.append("->nullOnDelete()")
         elif on_delete == 'restrict':
-            line += "->restrictOnDelete()"
+            parts.append("->restrictOnDelete()")
 
         if on_update == 'cascade':
-            line += "->cascadeOnUpdate()"
+            parts.append("->cascadeOnUpdate()")
         elif on_update == 'restrict':
-            line += "->restrictOnUpdate()"
+            parts.append("->restrictOnUpdate()")
 
-        line += ";"
-        return line
+        parts.append(";")
+        return "".join(parts)
 
     def generate_model(self, table: Dict):
         """Genera el modelo Eloquent"""
-        table_name = table['name']
-        model_name = self._to_studly_case(self._singular(table_name))
+        model_name = self._table_names(table['name'])['model_name']
 
         content = self._generate_model_content(table, model_name)
 
         filepath = f"{self.output_dir}/models/{model_name}.php"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_file(filepath, content)
 
     def _generate_model_content(self, table: Dict, model_name: str) -> str:
         """Genera el contenido del modelo"""
         table_name = table['name']
 
+        # fillable y casts en una sola pasada sobre las columnas
         fillable = []
-        for col in table['columns']:
-            if col['name'] not in ['id', 'created_at', 'updated_at', 'deleted_at']:
-                fillable.append(f"'{col['name']}'")
-
-        fillable_str = ",\n        ".join(fillable)
-
         casts = []
         for col in table['columns']:
-            col_type = col['type'].lower()
             name = col['name']
+            if name not in AUTO_COLUMNS:
+                fillable.append(f"'{name}'")
 
-            if col_type in ['datetime', 'timestamp']:
-                casts.append(f"'{name}' => 'datetime'")
-            elif col_type == 'date':
-                casts.append(f"'{name}' => 'date'")
-            elif col_type == 'json':
-                casts.append(f"'{name}' => 'array'")
-            elif col_type == 'boolean':
-                casts.append(f"'{name}' => 'boolean'")
-            elif col_type in ['int', 'tinyint', 'smallint', 'mediumint', 'bigint']:
-                casts.append(f"'{name}' => 'integer'")
-            elif col_type in ['decimal', 'float', 'double']:
-                casts.append(f"'{name}' => 'float'")
+            cast = MODEL_CAST_MAP.get(col['_type_lower'])
+            if cast:
+                casts.append(f"'{name}' => '{cast}'")
 
+        fillable_str = ",\n        ".join(fillable)
         casts_str = ",\n        ".join(casts) if casts else ""
 
         relationships_code = self._generate_relationships(table_name, model_name)
@@ -594,52 +1093,40 @@ return new class extends Migration
 
         use_str = "\n".join(use_statements)
 
-        return f"""<?php
-
-namespace App\\Models;
-
-{use_str}
-
-class {model_name} extends Model
-{{
-    {traits_str}
-
-    protected $table = '{table_name}';
-
-    protected $fillable = [
-        {fillable_str}
-    ];
-
-    protected $casts = [
-        {casts_str}
-    ];
-{relationships_code}
-}}
-"""
+        return MODEL_TEMPLATE.format_map({
+            'use_str': use_str,
+            'model_name': model_name,
+            'traits_str': traits_str,
+            'table_name': table_name,
+            'fillable_str': fillable_str,
+            'casts_str': casts_str,
+            'relationships_code': relationships_code,
+        })
 
     def _generate_relationships(self, table_name: str, model_name: str) -> str:
         """Genera métodos de relaciones del modelo"""
+        if not self._has_relationships:
+            return ""
         relationships = []
 
-        for rel in self.relationships:
-            if rel['source_table'] == table_name:
-                target_model = self._to_studly_case(self._singular(rel['target_table']))
-                source_col = rel['source_columns'][0] if rel['source_columns'] else 'id'
-                method_name = self._to_camel_case(self._singular(rel['target_table']))
+        for rel in self._fks_by_source.get(table_name, ()):
+            target = self._table_names(rel['target_table'])
+            target_model = target['model_name']
+            source_col = rel['source_columns'][0] if rel['source_columns'] else 'id'
+            method_name = target['method_name']
 
-                relationships.append(f"""
+            relationships.append(f"""
     public function {method_name}()
     {{
         return $this->belongsTo({target_model}::class, '{source_col}');
     }}""")
 
-        for rel in self.relationships:
-            if rel['target_table'] == table_name:
-                source_model = self._to_studly_case(self._singular(rel['source_table']))
-                foreign_col = rel['source_columns'][0] if rel['source_columns'] else 'id'
-                method_name = self._to_camel_case(rel['source_table'])
+        for rel in self._fks_by_target.get(table_name, ()):
+            source_model = self._table_names(rel['source_table'])['model_name']
+            foreign_col = rel['source_columns'][0] if rel['source_columns'] else 'id'
+            method_name = self._to_camel_case(rel['source_table'])
 
-                relationships.append(f"""
+            relationships.append(f"""
     public function {method_name}()
     {{
         return $this->hasMany({source_model}::class, '{foreign_col}');
@@ -649,209 +1136,110 @@ class {model_name} extends Model
 
     def generate_controller(self, table: Dict):
         """Genera el controlador API"""
-        table_name = table['name']
-        model_name = self._to_studly_case(self._singular(table_name))
-        controller_name = f"{model_name}Controller"
+        names = self._table_names(table['name'])
+        model_name = names['model_name']
+        controller_name = names['controller_name']
 
         content = self._generate_controller_content(table, model_name, controller_name)
 
         filepath = f"{self.output_dir}/controllers/{controller_name}.php"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_file(filepath, content)
 
     def _generate_controller_content(self, table: Dict, model_name: str, controller_name: str) -> str:
         """Genera el contenido del controlador"""
         validation_rules = self._generate_validation_rules(table)
-        var_name = self._to_camel_case(model_name)
+        var_name = self._table_names(table['name'])['var_name']
         with_relations = self._get_with_relations(table['name'])
         load_relations = self._get_load_relations_string(table['name'])
 
-        return f"""<?php
-
-namespace App\\Http\\Controllers\\Api;
-
-use App\\Http\\Controllers\\Controller;
-use App\\Models\\{model_name};
-use Illuminate\\Http\\Request;
-use Illuminate\\Http\\JsonResponse;
-
-class {controller_name} extends Controller
-{{
-    /**
-     * Display a listing of the resource.
-     */
-    public function index(): JsonResponse
-    {{
-        ${var_name}s = {model_name}::query(){with_relations}->get();
-
-        return response()->json([
-            'success' => true,
-            'data' => ${var_name}s
-        ]);
-    }}
-
-    /**
-     * Store a newly created resource in storage.
-     */
-    public function store(Request $request): JsonResponse
-    {{
-        $validated = $request->validate([
-{validation_rules}
-        ]);
-
-        ${var_name} = {model_name}::create($validated);
-
-        // Cargar relaciones
-        {load_relations}
-
-        return response()->json([
-            'success' => true,
-            'message' => '{model_name} created successfully',
-            'data' => ${var_name}
-        ], 201);
-    }}
-
-    /**
-     * Display the specified resource.
-     */
-    public function show({model_name} ${var_name}): JsonResponse
-    {{
-        // Cargar relaciones
-        {load_relations}
-
-        return response()->json([
-            'success' => true,
-            'data' => ${var_name}
-        ]);
-    }}
-
-    /**
-     * Update the specified resource in storage.
-     */
-    public function update(Request $request, {model_name} ${var_name}): JsonResponse
-    {{
-        $validated = $request->validate([
-{validation_rules}
-        ]);
-
-        ${var_name}->update($validated);
-
-        // Recargar relaciones
-        {load_relations}
-
-        return response()->json([
-            'success' => true,
-            'message' => '{model_name} updated successfully',
-            'data' => ${var_name}
-        ]);
-    }}
-
-    /**
-     * Remove the specified resource from storage.
-     */
-    public function destroy({model_name} ${var_name}): JsonResponse
-    {{
-        ${var_name}->delete();
-
-        return response()->json([
-            'success' => true,
-            'message' => '{model_name} deleted successfully'
-        ]);
-    }}
-}}
-"""
+        return CONTROLLER_TEMPLATE.format_map({
+            'model_name': model_name,
+            'controller_name': controller_name,
+            'var_name': var_name,
+            'with_relations': with_relations,
+            'validation_rules': validation_rules,
+            'load_relations': load_relations,
+        })
+
+    def _relation_method_names(self, table_name: str) -> str:
+        """Devuelve (y memoriza) la lista PHP de relaciones belongsTo: 'a', 'b'"""
+        relations = self._relations_cache.get(table_name)
+        if relations is None:
+            relations = ', '.join(
+                f"'{self._table_names(rel['target_table'])['method_name']}'"
+                for rel in self._fks_by_source.get(table_name, ())
+            )
+            self._relations_cache[table_name] = relations
+        return relations
 
     def _get_with_relations(self, table_name: str) -> str:
         """Obtiene las relaciones para usar con ->with() en queries"""
-        relations = []
-
-        for rel in self.relationships:
-            if rel['source_table'] == table_name:
-                method_name = self._to_camel_case(self._singular(rel['target_table']))
-                relations.append(f"'{method_name}'")
-
+        if not self._has_relationships:
+            return ""
+        relations = self._relation_method_names(table_name)
         if relations:
-            return f"->with([{', '.join(relations)}])"
+            return f"->with([{relations}])"
         return ""
 
     def _get_load_relations_string(self, table_name: str) -> str:
         """Obtiene string para cargar relaciones con ->load()"""
-        relations = []
-
-        for rel in self.relationships:
-            if rel['source_table'] == table_name:
-                method_name = self._to_camel_case(self._singular(rel['target_table']))
-                relations.append(f"'{method_name}'")
-
+        if not self._has_relationships:
+            return "// No hay relaciones para cargar"
+        relations = self._relation_method_names(table_name)
         if relations:
-            var_name = self._to_camel_case(self._singular(table_name))
-            return f"${var_name}->load([{', '.join(relations)}]);"
+            var_name = self._table_names(table_name)['method_name']
+            return f"${var_name}->load([{relations}]);"
         return "// No hay relaciones para cargar"
 
     def _generate_validation_rules(self, table: Dict) -> str:
         """Genera reglas de validación para el controlador"""
-        rules = []
+        table_name = table['name']
+        # Un solo búfer para todas las líneas: "'col' => 'regla|regla'," por columna
+        parts = []
 
         for col in table['columns']:
-            if col['name'] in ['id', 'created_at', 'updated_at', 'deleted_at']:
+            name = col['name']
+            if name in AUTO_COLUMNS:
                 continue
 
-            rule_parts = []
+            parts.append(f"            '{name}' => '")
+            parts.append('required' if col['not_null'] else 'nullable')
 
-            if col['not_null']:
-                rule_parts.append('required')
-            else:
-                rule_parts.append('nullable')
-
-            col_type = col['type'].lower()
-            if col_type in ['int', 'tinyint', 'smallint', 'mediumint', 'bigint']:
-                rule_parts.append('integer')
-            elif col_type in ['decimal', 'float', 'double']:
-                rule_parts.append('numeric')
-            elif col_type in ['varchar', 'char', 'text', 'mediumtext', 'longtext']:
-                rule_parts.append('string')
-                if col['length']:
-                    rule_parts.append(f'max:{col["length"]}')
-            elif col_type in ['date']:
-                rule_parts.append('date')
-            elif col_type in ['datetime', 'timestamp']:
-                rule_parts.append('date')
-            elif col_type == 'boolean':
-                rule_parts.append('boolean')
-            elif col_type == 'json':
-                rule_parts.append('array')
-
-            is_foreign_key = False
-            for rel in self.relationships:
-                if rel['source_table'] == table['name'] and col['name'] in rel['source_columns']:
-                    target_table = rel['target_table']
-                    target_col = rel['target_columns'][0] if rel['target_columns'] else 'id'
-                    rule_parts.append(f'exists:{target_table},{target_col}')
-                    is_foreign_key = True
-                    break
-
-            rule_str = '|'.join(rule_parts)
-            rules.append(f"            '{col['name']}' => '{rule_str}'")
-
-        return ",\n".join(rules)
+            type_rule = VALIDATION_TYPE_RULES.get(col['_type_lower'])
+            if type_rule:
+                parts.append(f"|{type_rule}")
+                if type_rule == 'string' and col['length']:
+                    parts.append(f"|max:{col['length']}")
+
+            rel = self._fk_by_column.get((table_name, name))
+            if rel:
+                target_table = rel['target_table']
+                target_col = rel['target_columns'][0] if rel['target_columns'] else 'id'
+                parts.append(f"|exists:{target_table},{target_col}")
+
+            parts.append("',\n")
+
+        # La última línea no lleva coma ni salto de línea
+        if parts:
+            parts[-1] = "'"
+        return "".join(parts)
 
     # -------------------------------------------------------------------------
     # SEEDER GENERATION
     # -------------------------------------------------------------------------
 
-    def generate_seeder(self, table: Dict):
-        """Genera un seeder para la tabla usando Faker con 10 registros"""
-        table_name = table['name']
-        model_name = self._to_studly_case(self._singular(table_name))
-        seeder_name = f"{model_name}Seeder"
+    def generate_seeder(self, table: Dict) -> str:
+        """Genera un seeder para la tabla usando Faker con 10 registros y devuelve su nombre"""
+        names = self._table_names(table['name'])
+        model_name = names['model_name']
+        seeder_name = names['seeder_name']
 
         content = self._generate_seeder_content(table, model_name, seeder_name)
 
         filepath = f"{self.output_dir}/seeders/{seeder_name}.php"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_file(filepath, content)
 
-        print(f"  ✓ Seeder generado: {seeder_name}.php")
+        return f"{seeder_name}.php"
 
     def _generate_seeder_content(self, table: Dict, model_name: str, seeder_name: str) -> str:
         """Genera el contenido de un seeder con Faker"""
@@ -859,43 +1247,25 @@ class {controller_name} extends Controller
 
         # Construir el array de faker para cada columna
         faker_fields = self._build_faker_fields(table)
-        faker_fields_str = "\n".join(faker_fields)
-
-        # Determinar qué modelos/IDs necesitamos para FKs
-        fk_imports, fk_setup = self._build_fk_setup(table)
-        fk_imports_str = "\n".join(fk_imports)
-        fk_setup_str = "\n        ".join(fk_setup)
-
-        return f"""<?php
-
-namespace Database\\Seeders;
-
-use App\\Models\\{model_name};
-{fk_imports_str}
-use Illuminate\\Database\\Seeder;
-use Illuminate\\Support\\Facades\\DB;
-
-class {seeder_name} extends Seeder
-{{
-    /**
-     * Run the database seeds.
-     * Genera 10 registros de prueba para la tabla {table_name}.
-     */
-    public function run(): void
-    {{
-        $faker = \\Faker\\Factory::create('es_MX');
-
-        // Precargar IDs de tablas relacionadas
-        {fk_setup_str if fk_setup_str.strip() else '// Sin dependencias de FK'}
-
-        for ($i = 0; $i < 10; $i++) {{
-            {model_name}::create([
-{faker_fields_str}
-            ]);
-        }}
-    }}
-}}
-"""
+        # La sangría se pone una sola vez, en el separador
+        faker_fields_str = "                " + "\n                ".join(faker_fields) if faker_fields else ""
+
+        # Determinar qué modelos/IDs necesitamos para FKs (tablas sin FKs: nada que armar)
+        fk_imports_str = ""
+        fk_setup_str = ""
+        if self._fks_by_source.get(table_name):
+            fk_imports, fk_setup = self._build_fk_setup(table)
+            # Cada import con su salto de línea: sin FKs no queda una línea vacía
+            fk_imports_str = "".join(f"{line}\n" for line in fk_imports)
+            fk_setup_str = "\n        ".join(fk_setup)
+
+        return SEEDER_TEMPLATE.format_map({
+            'seeder_name': seeder_name,
+            'table_name': table_name,
+            'fk_imports': fk_imports_str,
+            'fk_setup': fk_setup_str or '// Sin dependencias de FK',
+            'faker_fields': faker_fields_str,
+        })
 
     def _build_fk_setup(self, table: Dict):
         """Construye imports y setup para foreign keys"""
@@ -903,48 +1273,47 @@ class {seeder_name} extends Seeder
         setup = []
         seen_tables = set()
 
-        for rel in self.relationships:
-            if rel['source_table'] == table['name'] and rel['target_table']:
-                target_table = rel['target_table']
-                if target_table in seen_tables:
-                    continue
-                seen_tables.add(target_table)
+        for rel in self._fks_by_source.get(table['name'], ()):
+            target_table = rel['target_table']
+            if not target_table or target_table in seen_tables:
+                continue
+            seen_tables.add(target_table)
 
-                target_model = self._to_studly_case(self._singular(target_table))
-                var_ids = f"${self._to_camel_case(target_model)}Ids"
+            target = self._table_names(target_table)
+            target_model = target['model_name']
+            var_ids = f"${target['var_name']}Ids"
 
-                imports.append(f"use App\\Models\\{target_model};")
-                setup.append(
-                    f"{var_ids} = {target_model}::pluck('id')->toArray();"
-                )
+            imports.append(f"use App\\Models\\{target_model};")
+            setup.append(
+                f"{var_ids} = {target_model}::pluck('id')->toArray();"
+            )
 
         return imports, setup
 
     def _build_faker_fields(self, table: Dict) -> List[str]:
-        """Genera las líneas de faker para cada campo de la tabla"""
+        """Genera las líneas de faker (sin sangría) para cada campo de la tabla"""
         lines = []
+        table_name = table['name']
+        # Consulta directa al índice (gana la primera relación, igual que _get_fk_relation)
+        fk_by_column = self._fk_by_column
 
         for col in table['columns']:
             name = col['name']
 
             # Saltar campos automáticos
-            if name in ['id', 'created_at', 'updated_at', 'deleted_at']:
+            if name in AUTO_COLUMNS:
                 continue
 
             # Si es FK, usar pluck de IDs
-            fk_rel = self._get_fk_relation(name, table['name'])
+            fk_rel = fk_by_column.get((table_name, name))
             if fk_rel:
-                target_model = self._to_studly_case(self._singular(fk_rel['target_table']))
-                var_ids = f"${self._to_camel_case(target_model)}Ids"
-                is_nullable = not col['not_null']
-                if is_nullable:
-                    lines.append(
-                        f"                '{name}' => !empty({var_ids}) ? $faker->randomElement({var_ids}) : null,"
-                    )
-                else:
-                    lines.append(
-                        f"                '{name}' => !empty({var_ids}) ? $faker->randomElement({var_ids}) : 1,"
-                    )
+                target = self._table_names(fk_rel['target_table'])
+                var_ids = f"${target['var_name']}Ids"
+                # Sin IDs disponibles: null si la FK lo admite, si no el id 1
+                fallback = _FK_SEED_FALLBACK[col['not_null']]
+                lines.append(
+                    f"'{name}' => !empty({var_ids}) ? $faker->randomElement({var_ids}) : {fallback},"
+                )
                 continue
 
             faker_value = self._get_faker_value(name, col)
@@ -952,19 +1321,16 @@ class {seeder_name} extends Seeder
 
             if is_nullable:
                 lines.append(
-                    f"                '{name}' => $faker->optional()->randomElement([{faker_value}, null]) ?? {faker_value},"
+                    f"'{name}' => $faker->optional()->randomElement([{faker_value}, null]) ?? {faker_value},"
                 )
             else:
-                lines.append(f"                '{name}' => {faker_value},")
+                lines.append(f"'{name}' => {faker_value},")
 
         return lines
 
     def _get_fk_relation(self, column_name: str, table_name: str):
         """Devuelve la relación FK si la columna es FK, o None"""
-        for rel in self.relationships:
-            if rel['source_table'] == table_name and column_name in rel.get('source_columns', []):
-                return rel
-        return None
+        return self._fk_by_column.get((table_name, column_name))
 
     def _get_faker_value(self, col_name: str, col: Dict) -> str:
         """
@@ -972,141 +1338,14 @@ class {seeder_name} extends Seeder
         Primero detecta por palabras clave CONTENIDAS en el nombre (contains),
         luego por tipo SQL. Nunca usa lexify — siempre genera palabras reales.
         """
-        name_lower = col_name.lower()
-        col_type = col['type'].lower()
-        base_type = col_type.split('(')[0].strip()
-
         # ── Detección por palabras clave contenidas en el nombre ──────────
-        # Nombres / personas
-        if name_lower in ['nombre', 'name', 'nombre_completo', 'full_name', 'nombres']:
-            return "$faker->firstName()"
-        if 'apellido' in name_lower or name_lower in ['last_name', 'surname']:
-            return "$faker->lastName()"
-        if name_lower in ['nombre_usuario', 'username', 'user_name', 'nick', 'alias']:
-            return "$faker->unique()->userName()"
-
-        # Contacto
-        if 'email' in name_lower or 'correo' in name_lower:
-            return "$faker->unique()->safeEmail()"
-        if 'telefono' in name_lower or 'phone' in name_lower or 'celular' in name_lower \
-                or 'movil' in name_lower or name_lower in ['tel', 'fono']:
-            return "$faker->phoneNumber()"
-
-        # Ubicación
-        if 'direccion' in name_lower or 'address' in name_lower or 'domicilio' in name_lower:
-            return "$faker->streetAddress()"
-        if 'ciudad' in name_lower or 'city' in name_lower:
-            return "$faker->city()"
-        if name_lower in ['estado', 'state', 'provincia', 'region']:
-            return "$faker->state()"
-        if 'pais' in name_lower or 'country' in name_lower:
-            return "$faker->country()"
-        if 'postal' in name_lower or name_lower in ['cp', 'zip', 'codigo_postal']:
-            return "$faker->postcode()"
-        if 'colonia' in name_lower or 'barrio' in name_lower or 'neighborhood' in name_lower:
-            return "$faker->citySuffix() . ' ' . $faker->city()"
-        if 'municipio' in name_lower or 'delegacion' in name_lower:
-            return "$faker->city()"
-
-        # Credenciales
-        if 'password' in name_lower or 'contrasena' in name_lower or 'contrasenia' in name_lower:
-            return "bcrypt($faker->password(8, 16))"
-        if 'token' in name_lower or 'api_key' in name_lower:
-            return "$faker->sha256()"
-
-        # Dinero
-        if 'precio' in name_lower or 'price' in name_lower or 'costo' in name_lower \
-                or 'cost' in name_lower or 'monto' in name_lower or 'amount' in name_lower \
-                or 'tarifa' in name_lower or 'salario' in name_lower or 'sueldo' in name_lower \
-                or 'pago' in name_lower or 'total' in name_lower or 'subtotal' in name_lower \
-                or 'descuento' in name_lower or 'impuesto' in name_lower:
-            return "$faker->randomFloat(2, 10, 9999)"
-
-        # Fechas
-        if 'fecha' in name_lower or ('date' in name_lower and 'update' not in name_lower):
-            if 'nacimiento' in name_lower or 'birth' in name_lower:
-                return "$faker->date('Y-m-d', '-18 years')"
-            if 'inicio' in name_lower or 'start' in name_lower or 'alta' in name_lower:
-                return "$faker->dateTimeBetween('-1 year', 'now')->format('Y-m-d')"
-            if 'fin' in name_lower or 'end' in name_lower or 'vencimiento' in name_lower \
-                    or 'expir' in name_lower:
-                return "$faker->dateTimeBetween('now', '+2 years')->format('Y-m-d')"
-            return "$faker->date('Y-m-d')"
-
-        # Horas
-        if 'hora' in name_lower or ('time' in name_lower and 'datetime' not in name_lower
-                                    and 'timestamp' not in name_lower):
-            return "$faker->time('H:i:s')"
-
-        # Números / medidas
-        if 'edad' in name_lower or name_lower in ['age', 'years', 'anios']:
-            return "$faker->numberBetween(1, 99)"
-        if 'duracion' in name_lower or 'duration' in name_lower or 'minutos' in name_lower \
-                or 'minutes' in name_lower:
-            return "$faker->numberBetween(15, 120)"
-        if 'cantidad' in name_lower or 'quantity' in name_lower or 'stock' in name_lower \
-                or 'capacidad' in name_lower:
-            return "$faker->numberBetween(1, 500)"
-        if 'numero' in name_lower or 'number' in name_lower or 'num' == name_lower \
-                or 'folio' in name_lower:
-            return "$faker->numerify('####')"
-        if 'calificacion' in name_lower or 'rating' in name_lower or 'puntuacion' in name_lower \
-                or 'score' in name_lower:
-            return "$faker->numberBetween(1, 10)"
-        if 'porcentaje' in name_lower or 'percent' in name_lower:
-            return "$faker->numberBetween(0, 100)"
-
-        # Textos descriptivos
-        if 'descripcion' in name_lower or 'description' in name_lower or 'detalle' in name_lower \
-                or 'nota' in name_lower or 'observacion' in name_lower or 'comentario' in name_lower \
-                or 'resumen' in name_lower or 'biografia' in name_lower or 'bio' in name_lower:
-            return "$faker->sentence(12)"
-        if 'titulo' in name_lower or 'title' in name_lower or 'nombre' in name_lower:
-            return "$faker->sentence(3)"
-        if 'especialidad' in name_lower or 'specialty' in name_lower or 'profesion' in name_lower \
-                or 'profession' in name_lower or 'ocupacion' in name_lower or 'cargo' in name_lower \
-                or 'puesto' in name_lower or 'job' in name_lower or 'position' in name_lower:
-            return "$faker->jobTitle()"
-        if 'empresa' in name_lower or 'company' in name_lower or 'negocio' in name_lower \
-                or 'organizacion' in name_lower:
-            return "$faker->company()"
-        if 'categoria' in name_lower or 'category' in name_lower or 'tipo' in name_lower \
-                or 'type' in name_lower or 'clase' in name_lower:
-            return "$faker->randomElement(['Tipo A', 'Tipo B', 'Tipo C', 'Especial'])"
-        if 'estado' in name_lower or 'status' in name_lower or 'estatus' in name_lower:
-            return "$faker->randomElement(['activo', 'inactivo', 'pendiente'])"
-        if 'genero' in name_lower or 'gender' in name_lower or 'sexo' in name_lower:
-            return "$faker->randomElement(['masculino', 'femenino', 'otro'])"
-        if 'color' in name_lower:
-            return "$faker->colorName()"
-
-        # Media / archivos
-        if 'url' in name_lower or 'link' in name_lower or 'web' in name_lower \
-                or 'sitio' in name_lower:
-            return "$faker->url()"
-        if 'imagen' in name_lower or 'foto' in name_lower or 'image' in name_lower \
-                or 'photo' in name_lower or 'avatar' in name_lower:
-            return "$faker->imageUrl(640, 480)"
-        if 'archivo' in name_lower or 'file' in name_lower or 'documento' in name_lower:
-            return "$faker->lexify('doc_??????.pdf')"
-
-        # Identificadores únicos
-        if name_lower in ['uuid', 'guid']:
-            return "$faker->uuid()"
-        if name_lower in ['ip', 'ip_address']:
-            return "$faker->ipv4()"
-        if 'activo' in name_lower or 'active' in name_lower or 'habilitado' in name_lower \
-                or 'enabled' in name_lower or 'visible' in name_lower:
-            return "$faker->boolean()"
+        value = self._faker_value_for_name(col['_name_lower'])
+        if value is not None:
+            return value
 
         # ── Fallback por tipo SQL ─────────────────────────────────────────
-        if base_type in ['int', 'integer', 'smallint', 'mediumint']:
-            return "$faker->numberBetween(1, 100)"
-        if base_type == 'bigint':
-            return "$faker->numberBetween(1, 1000)"
-        if base_type in ['decimal', 'float', 'double']:
-            return "$faker->randomFloat(2, 1, 1000)"
-        if base_type in ['varchar', 'char']:
+        base_type = col['_base_type']
+        if base_type in ('varchar', 'char'):
             # Usar palabras reales según el largo del campo
             length = col.get('length', '255')
             try:
@@ -1119,23 +1358,16 @@ class {seeder_name} extends Seeder
                 return "$faker->words(2, true)"
             else:
                 return "$faker->words(3, true)"
-        if base_type == 'text':
-            return "$faker->paragraph()"
-        if base_type in ['mediumtext', 'longtext']:
-            return "$faker->paragraphs(3, true)"
-        if base_type == 'boolean':
-            return "$faker->boolean()"
-        if base_type == 'date':
-            return "$faker->date('Y-m-d')"
-        if base_type in ['datetime', 'timestamp']:
-            return "$faker->dateTime()->format('Y-m-d H:i:s')"
-        if base_type == 'time':
-            return "$faker->time('H:i:s')"
-        if base_type == 'json':
-            return "json_encode(['valor' => $faker->word(), 'descripcion' => $faker->sentence()])"
 
         # Fallback final — siempre palabras reales
-        return "$faker->words(2, true)"
+        return FAKER_TYPE_VALUES.get(base_type, "$faker->words(2, true)")
+
+    # Los mismos nombres de columna (nombre, descripcion, estado...) se repiten
+    # en muchas tablas: la regla se busca una vez por nombre distinto
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _faker_value_for_name(name_lower: str):
+        return _match_faker_rule(_FAKER_NAME_RULES, name_lower)
 
     def generate_database_seeder(self):
         """
@@ -1144,47 +1376,27 @@ class {seeder_name} extends Seeder
         Las tablas excluidas (que ya tienen sus seeders originales) se llaman primero.
         """
         # Seeders originales que siempre van primero (en el orden del DatabaseSeeder original)
-        original_seeders = ['RolSeeder', 'EstatusSeeder', 'UserSeeder']
+        original_seeders = ('RolSeeder', 'EstatusSeeder', 'UserSeeder')
 
         # Seeders generados automáticamente (en orden de migración, sin las excluidas)
-        generated_seeders = []
-        for table in self.tables:
-            if table['name'].lower() not in self.SEEDER_EXCLUDED_TABLES:
-                model_name = self._to_studly_case(self._singular(table['name']))
-                generated_seeders.append(f"{model_name}Seeder")
+        all_names = map(self._table_names, (table['name'] for table in self.tables))
+        generated_seeders = [
+            names['seeder_name'] for names in all_names
+            if names['name_lower'] not in self.SEEDER_EXCLUDED_TABLES
+        ]
 
         # Construir las llamadas
-        all_calls = []
-        for seeder in original_seeders:
-            all_calls.append(f"        $this->call({seeder}::class);")
-        for seeder in generated_seeders:
-            all_calls.append(f"        $this->call({seeder}::class);")
+        all_calls = [
+            f"        $this->call({seeder}::class);"
+            for seeder in (*original_seeders, *generated_seeders)
+        ]
 
         calls_str = "\n".join(all_calls)
 
-        content = f"""<?php
-
-namespace Database\\Seeders;
-
-// use Illuminate\\Database\\Console\\Seeds\\WithoutModelEvents;
-use Illuminate\\Database\\Seeder;
-
-class DatabaseSeeder extends Seeder
-{{
-    /**
-     * Seed the application's database.
-     * Orden: tablas base → tablas con dependencias (respeta FK order).
-     */
-    public function run(): void
-    {{
-{calls_str}
-    }}
-}}
-"""
+        content = DATABASE_SEEDER_TEMPLATE.format_map({'calls': calls_str})
 
         filepath = f"{self.output_dir}/seeders/DatabaseSeeder.php"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_file(filepath, content)
 
         print(f"  ✓ DatabaseSeeder.php generado con {len(all_calls)} seeders en orden correcto")
 
@@ -1194,70 +1406,62 @@ class DatabaseSeeder extends Seeder
 
     def generate_routes(self):
         """Genera el archivo de rutas API"""
-        routes = []
-
-        for table in self.tables:
-            model_name = self._to_studly_case(self._singular(table['name']))
-            controller_name = f"{model_name}Controller"
-            route_name = self._to_kebab_case(table['name'])
-
-            routes.append(
-                f"Route::apiResource('{route_name}', "
-                f"\\App\\Http\\Controllers\\Api\\{controller_name}::class);"
-            )
-
-        routes_str = "\n".join(routes)
-
-        content = f"""<?php
-
-    use Illuminate\\Http\\Request;
-    use Illuminate\\Support\\Facades\\Route;
-
-
-    /*
-    |--------------------------------------------------------------------------
-    | API Routes
-    |--------------------------------------------------------------------------
-    */
+        # Los nombres memorizados de cada tabla ya traen route_name y controller_name
+        routes_str = "\n".join(
+            ROUTE_LINE_TEMPLATE.format_map(self._table_names(table['name']))
+            for table in self.tables
+        )
 
-    // Rutas API generadas automáticamente
-    {routes_str}
-    """
+        content = ROUTES_TEMPLATE.format_map({'routes': routes_str})
 
         filepath = f"{self.output_dir}/routes/api.php"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_file(filepath, content)
 
     # -------------------------------------------------------------------------
     # HELPERS
     # -------------------------------------------------------------------------
 
-    def _to_studly_case(self, string: str) -> str:
+    def _write_file(self, filepath: str, content: str):
+        """Escribe el archivo como bytes UTF-8 directamente sobre el descriptor"""
+        if self._zip is not None:
+            self._zip.writestr(os.path.relpath(filepath, self.output_dir), content)
+            return
+
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    # Conversiones de nombres memorizadas: se repiten con los mismos nombres de
+    # tablas en cada relación. Caché sin límite: las entradas distintas están
+    # acotadas por los nombres del esquema
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _to_studly_case(string: str) -> str:
         return ''.join(word.capitalize() for word in string.replace('_', ' ').split())
 
-    def _to_camel_case(self, string: str) -> str:
-        studly = self._to_studly_case(string)
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _to_camel_case(string: str) -> str:
+        studly = LaravelGenerator._to_studly_case(string)
         return studly[0].lower() + studly[1:] if studly else ''
 
-    def _to_kebab_case(self, string: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _to_kebab_case(string: str) -> str:
         return string.replace('_', '-').lower()
 
-    def _singular(self, word: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _singular(word: str) -> str:
         """Intenta singularizar una palabra (incluye español)"""
         word_lower = word.lower()
 
-        irregulars_es = {
-            'clientes': 'cliente',
-            'medicos': 'medico',
-            'servicios': 'servicio',
-            'horarios': 'horario',
-            'estatus': 'estatus',
-            'roles': 'rol',
-            'users': 'user',
-        }
-
-        if word_lower in irregulars_es:
-            result = irregulars_es[word_lower]
+        if word_lower in SINGULAR_IRREGULARS_ES:
+            result = SINGULAR_IRREGULARS_ES[word_lower]
             if word[0].isupper():
                 result = result.capitalize()
             return result
@@ -1272,10 +1476,27 @@ class DatabaseSeeder extends Seeder
         return word
 
 
+
+# Generador compartido por cada proceso del pool (se envía una sola vez al iniciarlo)
+_worker_generator = None
+
+
+def _init_worker(generator: 'LaravelGenerator'):
+    """Inicializa un proceso del pool con su copia del generador"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_table_in_worker(job: Tuple[int, Dict]) -> List[str]:
+    """Genera los archivos de una tabla dentro de un proceso del pool"""
+    number, table = job
+    return _worker_generator._generate_table_files(table, number)
+
+
 def main():
     """Función principal"""
     if len(sys.argv) < 2:
-        print("Uso: python laravel_generator.py <archivo.mwb> [directorio_salida]")
+        print("Uso: python laravel_generator.py <archivo.mwb> [directorio_salida | salida.zip]")
         sys.exit(1)
 
     mwb_file = sys.argv[1]
@@ -1301,7 +1522,12 @@ def main():
     print(f"✓ Se encontraron {len(parser.relationships)} relaciones\n")
 
     print("Generando archivos Laravel...")
-    generator = LaravelGenerator(parser.tables, parser.relationships, output_dir)
+    if output_dir.endswith('.zip'):
+        # Generar directamente un .zip con migrations/, models/, controllers/...
+        generator = LaravelGenerator(parser.tables, parser.relationships,
+                                     output_dir[:-len('.zip')], output_zip=output_dir)
+    else:
+        generator = LaravelGenerator(parser.tables, parser.relationships, output_dir)
     generator.generate_all()
 
 
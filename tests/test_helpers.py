@@ -0,0 +1,28 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers import NamingHelper
+
+
+class NamingHelperSuffixTest(unittest.TestCase):
+    """Reglas de plural/singular por sufijo"""
+
+    def test_plural_with_dollar(self):
+        self.assertEqual(NamingHelper.to_plural('a$ch'), 'a$ches')
+        self.assertEqual(NamingHelper.to_plural('BuO$f'), 'BuO$ves')
+        self.assertEqual(NamingHelper.to_plural('u-$s'), 'u-$ses')
+
+    def test_singular_with_dollar(self):
+        self.assertEqual(NamingHelper.to_singular('a$ies'), 'a$y')
+        self.assertEqual(NamingHelper.to_singular('a$ches'), 'a$ch')
+
+    def test_plain_suffixes(self):
+        self.assertEqual(NamingHelper.to_plural('church'), 'churches')
+        self.assertEqual(NamingHelper.to_singular('categories'), 'category')
+
+
+if __name__ == '__main__':
+    unittest.main()